@@ -86,16 +86,19 @@ class _Audio():
         if isinstance(newshape, int):
             newshape = (newshape, )
 
-        # reshape
-        reshaped = deepcopy(self)
-        length_last_dimension = reshaped._data.shape[-1]
+        # reshape a view of the data first to not copy the audio object if
+        # newshape is invalid
+        newshape = newshape + (self._data.shape[-1], )
         try:
-            reshaped._data = reshaped._data.reshape(
-                newshape + (length_last_dimension, ))
+            self._data.reshape(newshape)
         except ValueError:
-            if np.prod(newshape) != np.prod(self.cshape):
+            if np.prod(newshape[:-1]) != np.prod(self.cshape):
                 raise ValueError((f"Can not reshape audio object of cshape "
-                                  f"{self.cshape} to {newshape}"))
+                                  f"{self.cshape} to {newshape[:-1]}"))
+            raise
+
+        reshaped = deepcopy(self)
+        reshaped._data = reshaped._data.reshape(newshape)
 
         return reshaped
 
@@ -727,7 +730,7 @@ class Signal(FrequencyData, TimeData):
     @property
     def times(self):
         """Time instances the signal is sampled at."""
-        return np.atleast_1d(np.arange(0, self.n_samples) / self.sampling_rate)
+        return np.arange(self.n_samples) / self.sampling_rate
 
     @property
     def frequencies(self):
@@ -1743,13 +1743,28 @@ def cart2sph(x, y, z):
     implementation from numpy is used.
     """
     radius = np.sqrt(x**2 + y**2 + z**2)
-    z_div_r = np.where(radius != 0, z / radius, 0)
+    # only divide where the radius is not zero
+    z_div_r = np.divide(
+        z, radius, out=np.zeros_like(radius, dtype=float), where=radius != 0)
     colatitude = np.arccos(z_div_r)
-    azimuth = np.mod(np.arctan2(y, x), 2 * np.pi)
+    azimuth = _azimuth(x, y)
 
     return azimuth, colatitude, radius
 
 
+def _azimuth(x, y):
+    """
+    Azimuth angle in the range [0, 2 pi) from Cartesian coordinates.
+
+    Same as ``np.mod(np.arctan2(y, x), 2 * np.pi)`` but about three times
+    faster for large arrays.
+    """
+    azimuth = np.arctan2(y, x)
+    # adding zero also turns -0 into 0 as np.mod does
+    azimuth += (azimuth < 0) * (2 * np.pi)
+    return azimuth
+
+
 def sph2cart(azimuth, colatitude, radius):
     """
     Transforms from spherical to Cartesian coordinates.
@@ -1848,7 +1863,7 @@ def cart2cyl(x, y, z):
     To ensure proper handling of the azimuth angle, the ``arctan2``
     implementation from numpy is used.
     """
-    azimuth = np.mod(np.arctan2(y, x), 2 * np.pi)
+    azimuth = _azimuth(x, y)
     if isinstance(z, np.ndarray):
         height = z.copy()
     else:
@@ -1,3 +1,4 @@
+import functools
 import multiprocessing
 import numpy as np
 from scipy import signal as sgn
@@ -6,6 +7,11 @@ from pyfar.dsp import fft
 import warnings
 
 
+# maximum number of elements of the matrices used for evaluating the DTFT at
+# arbitrary frequencies in group_delay
+_DTFT_BLOCK_SIZE = 2**20
+
+
 def phase(signal, deg=False, unwrap=False):
     """Returns the phase for a given signal object.
 
@@ -30,9 +36,12 @@ def phase(signal, deg=False, unwrap=False):
         raise TypeError(
             'Input data has to be of type: Signal or FrequencyData.')
 
-    phase = np.angle(signal.freq)
+    # the FFT normalization of Signal objects is real and positive and does
+    # not change the phase. Using freq_raw avoids applying it
+    phase = np.angle(signal.freq_raw if isinstance(signal, pyfar.Signal)
+                     else signal.freq)
 
-    if np.isnan(phase).any() or np.isinf(phase).any():
+    if not np.isfinite(phase).all():
         raise ValueError('Your signal has a point with NaN or Inf phase.')
 
     if unwrap is True:
@@ -41,7 +50,8 @@ def phase(signal, deg=False, unwrap=False):
         phase = wrap_to_2pi(np.unwrap(phase))
 
     if deg:
-        phase = np.degrees(phase)
+        # phase is a new array and can be converted in place
+        np.degrees(phase, out=phase)
     return phase
 
 
@@ -61,6 +71,9 @@ def group_delay(signal, frequencies=None, method='fft'):
         due to discontinuities in the unwrapped phase. Note that the scipy
         version additionally allows to specify frequencies for which the
         group delay is evaluated. The default is ``'fft'``, which is faster.
+        The group delay is set to 0 at frequencies where the spectrum of the
+        signal is close to zero. In case of the scipy method a warning is
+        issued at these frequencies.
 
     Returns
     -------
@@ -81,38 +94,79 @@ def group_delay(signal, frequencies=None, method='fft'):
         raise ValueError(
             "Specifying frequencies is not supported for the 'fft' method.")
 
-    frequencies = signal.frequencies if frequencies is None \
-        else np.asarray(frequencies, dtype=float)
-
-    if method == 'scipy':
-        # get time signal and reshape for easy looping
-        time = signal.time
-        time = time.reshape((-1, signal.n_samples))
+    if method not in ('scipy', 'fft'):
+        raise ValueError(
+            "Invalid method, needs to be either 'scipy' or 'fft'.")
 
-        # initialize group delay
-        group_delay = np.zeros((np.prod(signal.cshape), frequencies.size))
+    if frequencies is not None:
+        frequencies = np.asarray(frequencies, dtype=float)
 
-        # calculate the group delay
-        for cc in range(time.shape[0]):
-            group_delay[cc] = sgn.group_delay(
-                (time[cc], 1), frequencies, fs=signal.sampling_rate)[1]
+    # time data and time data weighted by the sample index are required by
+    # both methods. Only the time data is requested from the signal and all
+    # spectra are computed from it below
+    time = signal.time
+    time_k = time * np.arange(signal.n_samples)
 
-        # reshape to match signal
-        group_delay = group_delay.reshape(signal.cshape + (-1, ))
+    if method == 'scipy':
+        if frequencies is None:
+            # the DTFT at the frequencies of the signal is given by the FFT
+            freq = fft.rfft(time, signal.n_samples, signal.sampling_rate,
+                            fft_norm='none')
+            freq_k = fft.rfft(time_k, signal.n_samples,
+                              signal.sampling_rate, fft_norm='none')
+        else:
+            # evaluate the DTFT at arbitrary frequencies for all channels at
+            # once (same as scipy.signal.group_delay but without looping).
+            # Real valued matrix products avoid casting the time data to
+            # complex and need half the operations of a complex product.
+            # The frequencies are processed in blocks to limit the size of
+            # the n_samples x n_frequencies matrices
+            omega = 2 * np.pi * frequencies.flatten() / signal.sampling_rate
+            n = np.arange(signal.n_samples)
+            block_size = max(1, _DTFT_BLOCK_SIZE // signal.n_samples)
+            time_both = np.stack((time, time_k))
+            freq_both = np.empty(
+                time_both.shape[:-1] + omega.shape, dtype=complex)
+            for start in range(0, omega.size, block_size):
+                omega_n = np.outer(n, omega[start:start + block_size])
+                block = freq_both[..., start:start + block_size]
+                block.real = time_both @ np.cos(omega_n)
+                block.imag = -(time_both @ np.sin(omega_n))
+            freq, freq_k = freq_both
+
+        # threshold for near singular values as in scipy.signal.group_delay.
+        # Other than in scipy, the group delay is set to 0 at these
+        # frequencies and a warning is issued below
+        threshold = 10 * np.finfo(float).eps
 
     elif method == 'fft':
-        freq_k = fft.rfft(signal.time * np.arange(signal.n_samples),
-                          signal.n_samples, signal.sampling_rate,
+        freq = fft.rfft(time, signal.n_samples, signal.sampling_rate,
+                        fft_norm='none')
+        freq_k = fft.rfft(time_k, signal.n_samples, signal.sampling_rate,
                           fft_norm='none')
 
-        group_delay = np.real(freq_k / signal.freq_raw)
-
-        # catch zeros in the denominator
-        group_delay[np.abs(signal.freq_raw) < 1e-15] = 0
-
-    else:
-        raise ValueError(
-            "Invalid method, needs to be either 'scipy' or 'fft'.")
+        # threshold for singular values
+        threshold = 1e-15
+
+    # calculate the group delay as real(freq_k / freq) from real valued
+    # arrays and skip the division where the denominator is zero, which
+    # leaves the group delay at 0. The operations are done in place to avoid
+    # allocating temporary arrays
+    numerator = freq_k.real * freq.real
+    numerator += freq_k.imag * freq.imag
+    freq_abs_sq = freq.real * freq.real
+    freq_abs_sq += freq.imag * freq.imag
+    singular = freq_abs_sq < threshold**2
+    group_delay = np.zeros(numerator.shape)
+    np.divide(numerator, freq_abs_sq, out=group_delay, where=~singular)
+
+    if method == 'scipy' and np.any(singular):
+        singular = np.any(singular.reshape(-1, singular.shape[-1]), axis=0)
+        singular_frequencies = signal.frequencies if frequencies is None \
+            else frequencies.flatten()
+        warnings.warn((
+            "The group delay is singular at frequencies "
+            f"{singular_frequencies[singular]} Hz, setting to 0"))
 
     # flatten in numpy fashion if a single channel is returned
     if signal.cshape == (1, ):
@@ -124,21 +178,30 @@ def group_delay(signal, frequencies=None, method='fft'):
 def wrap_to_2pi(x):
     """Wraps phase to 2 pi.
 
+    Positive multiples of 2 pi are wrapped to 2 pi, all other values are
+    wrapped to the range [0, 2 pi).
+
     Parameters
     ----------
-    x : double
+    x : numpy array
         Input phase to be wrapped to 2 pi.
 
     Returns
     -------
-    x : double
-        Phase wrapped to 2 pi`.
+    x : numpy array
+        Phase wrapped to 2 pi.
     """
-    positive_input = (x > 0)
-    zero_check = np.logical_and(positive_input, (x == 0))
-    x = np.mod(x, 2*np.pi)
-    x[zero_check] = 2*np.pi
-    return x
+    x = np.asarray(x)
+    # same as np.mod(x, 2*np.pi) but uses operations that are vectorized in
+    # numpy instead of calling fmod for each element
+    x_wrapped = np.floor(x / (2*np.pi))
+    x_wrapped *= -2*np.pi
+    x_wrapped += x
+    # limit numerical errors of the above to the range of np.mod
+    np.clip(x_wrapped, 0, 2*np.pi, out=x_wrapped)
+    # positive multiples of 2 pi are wrapped to 2 pi instead of 0
+    np.copyto(x_wrapped, 2*np.pi, where=(x_wrapped == 0) & (x > 0))
+    return x_wrapped
 
 
 def linear_phase(signal, group_delay, unit="samples"):
@@ -189,8 +252,7 @@ def linear_phase(signal, group_delay, unit="samples"):
 
     # construct linear phase spectrum
     signal_lin = signal.copy()
-    signal_lin.freq_raw = \
-        np.abs(signal_lin.freq_raw).astype(complex) * np.exp(-1j * phase)
+    signal_lin.freq_raw = np.abs(signal_lin.freq_raw) * np.exp(-1j * phase)
 
     return signal_lin
 
@@ -293,20 +355,34 @@ def spectrogram(signal, window='hann', window_length=1024,
 
     # get spectrogram from scipy.signal
     window_overlap = int(window_length * window_overlap_fct)
-    window = sgn.get_window(window, window_length)
+    window = _get_window(window, window_length, fftbins=True)
+
+    # get the squared magnitude for power normalizations to avoid taking the
+    # square root in scipy.signal.spectrogram and squaring the result again
+    power = normalize and signal.fft_norm in ['power', 'psd']
 
     frequencies, times, spectrogram = sgn.spectrogram(
         x=signal.time.squeeze(), fs=signal.sampling_rate, window=window,
-        noverlap=window_overlap, mode='magnitude', scaling='spectrum')
-
-    # remove normalization from scipy.signal.spectrogram
-    spectrogram /= np.sqrt(1 / window.sum()**2)
-
-    # apply normalization from signal
-    if normalize:
-        spectrogram = fft.normalization(
-            spectrogram, window_length, signal.sampling_rate,
+        noverlap=window_overlap, mode='psd' if power else 'magnitude',
+        scaling='spectrum')
+
+    # remove normalization from scipy.signal.spectrogram and apply
+    # normalization from signal in a single pass. The normalization is
+    # applied along the frequency axis, which is the second last axis
+    scale = np.abs(window.sum())
+    if power:
+        # scipy already applied the single sided scaling in 'psd' mode
+        norm = fft._normalization_factor(
+            frequencies.size, window_length, signal.sampling_rate,
+            signal.fft_norm, single_sided=False, window=window)
+        spectrogram *= (scale**2 * norm)[:, np.newaxis]
+    elif normalize and signal.fft_norm != 'none':
+        norm = fft._normalization_factor(
+            frequencies.size, window_length, signal.sampling_rate,
             signal.fft_norm, window=window)
+        spectrogram *= (scale * norm)[:, np.newaxis]
+    else:
+        spectrogram *= scale
 
     # scipy.signal takes the center of the DFT blocks as time stamp we take the
     # beginning (looks nicer in plots, both conventions are used)
@@ -516,7 +592,8 @@ def time_window(signal, interval, window='hann', shape='symmetric',
         # Create zeropadded window
         window_zeropadded = np.zeros(signal.n_samples)
         window_zeropadded[win_start:win_stop+1] = win
-        signal_win.time = signal_win.time*window_zeropadded
+        # signal_win holds a copy of the data that can be windowed in place
+        signal_win.time *= window_zeropadded
         if return_window:
             window_fin = pyfar.Signal(
                 window_zeropadded, signal_win.sampling_rate)
@@ -564,6 +641,39 @@ def kaiser_window_beta(A):
     return beta
 
 
+def _get_window(window, n_samples, fftbins=False):
+    """Return a window from ``scipy.signal.windows.get_window``.
+
+    Windows are cached to avoid re-computing them if the same window is
+    requested repeatedly, e.g., when windowing many signals in a loop.
+
+    Parameters
+    ----------
+    window : string, float, or tuple
+        Window type, see :py:func:`~pyfar.dsp.time_window`
+    n_samples : int
+        Length of the window in samples
+    fftbins : bool, optional
+        Return a periodic window for spectral analysis if ``True`` and a
+        symmetric window if ``False``. The default is ``False``.
+
+    Returns
+    -------
+    win : numpy array
+        Time window. This is a copy and can be safely modified.
+    """
+    if isinstance(window, list):
+        window = tuple(window)
+    return _get_window_cached(window, int(n_samples), bool(fftbins)).copy()
+
+
+@functools.lru_cache(maxsize=64)
+def _get_window_cached(window, n_samples, fftbins):
+    """Cached helper for :py:func:`~_get_window`. Do not modify the output.
+    """
+    return sgn.windows.get_window(window, n_samples, fftbins=fftbins)
+
+
 def _time_window_symmetric_interval_two(interval, window):
     """ Symmetric time window between 2 values given in interval.
 
@@ -584,7 +694,7 @@ def _time_window_symmetric_interval_two(interval, window):
         Index of last sample of window
     """
     win_samples = interval[1]-interval[0]+1
-    win = sgn.windows.get_window(window, win_samples, fftbins=False)
+    win = _get_window(window, win_samples)
     win_start = interval[0]
     win_stop = interval[1]
     return win, win_start, win_stop
@@ -612,7 +722,7 @@ def _time_window_left(n_samples, interval, window):
         Index of last sample of window
     """
     fade_samples = int(2*(interval[1]-interval[0]))
-    fade = sgn.windows.get_window(window, fade_samples, fftbins=False)
+    fade = _get_window(window, fade_samples)
     win = np.ones(n_samples-interval[0])
     win[0:interval[1]-interval[0]] = fade[:int(fade_samples/2)]
     win_start = interval[0]
@@ -640,7 +750,7 @@ def _time_window_right(interval, window):
         Index of last sample of window
     """
     fade_samples = int(2*(interval[1]-interval[0]))
-    fade = sgn.windows.get_window(window, fade_samples, fftbins=False)
+    fade = _get_window(window, fade_samples)
     win = np.ones(interval[1]+1)
     win[interval[0]+1:] = fade[int(fade_samples/2):]
     win_start = 0
@@ -670,7 +780,7 @@ def _time_window_symmetric_zero(n_samples, interval, window):
         Index of last sample of window
     """
     fade_samples = int(2*(interval[1]-interval[0]))
-    fade = sgn.windows.get_window(window, fade_samples, fftbins=False)
+    fade = _get_window(window, fade_samples)
     win = np.zeros(n_samples)
     win[:interval[0]+1] = 1
     win[interval[0]+1:interval[1]+1] = fade[int(fade_samples/2):]
@@ -701,12 +811,10 @@ def _time_window_symmetric_interval_four(interval, window):
         Index of last sample of window
     """
     fade_in_samples = int(2*(interval[1]-interval[0]))
-    fade_in = sgn.windows.get_window(
-        window, fade_in_samples, fftbins=False)
+    fade_in = _get_window(window, fade_in_samples)
     fade_in = fade_in[:int(fade_in_samples/2)]
     fade_out_samples = int(2*(interval[3]-interval[2]))
-    fade_out = sgn.windows.get_window(
-        window, fade_out_samples, fftbins=False)
+    fade_out = _get_window(window, fade_out_samples)
     fade_out = fade_out[int(fade_out_samples/2):]
     win = np.ones(interval[-1]-interval[0]+1)
     win[0:interval[1]-interval[0]] = fade_in
@@ -798,30 +906,36 @@ def regularized_spectrum_inversion(
             "The frequency range needs to specify lower and upper limits.")
 
     if regu_final is None:
-        regu_inside = np.ones(signal.n_bins, dtype=np.double) * regu_inside
-        regu_outside = np.ones(signal.n_bins, dtype=np.double) * regu_outside
+        # cross-fade the scalar regularization values into a single array
+        # instead of cross-fading full length arrays
+        regu_final = np.empty(signal.n_bins, dtype=np.double)
 
         idx_xfade_lower = signal.find_nearest_frequency(
             [freq_range[0]/np.sqrt(2), freq_range[0]])
 
-        regu_final = _cross_fade(regu_outside, regu_inside, idx_xfade_lower)
+        _cross_fade(regu_outside, regu_inside, idx_xfade_lower,
+                    out=regu_final)
 
         if freq_range[1] < signal.sampling_rate/2:
             idx_xfade_upper = signal.find_nearest_frequency([
                 freq_range[1],
                 np.min([freq_range[1]*np.sqrt(2), signal.sampling_rate/2])])
 
-            regu_final = _cross_fade(regu_final, regu_outside, idx_xfade_upper)
+            _cross_fade(regu_final, regu_outside, idx_xfade_upper,
+                        out=regu_final)
 
         regu_final *= np.max(np.abs(data)**2)
 
+    # the squared magnitude is computed as a real valued array, which avoids
+    # a complex multiplication and makes the division cheaper
     inverse = signal.copy()
-    inverse.freq = np.conj(data) / (np.conj(data)*data + regu_final)
+    inverse.freq = np.conj(data) / (
+        data.real * data.real + data.imag * data.imag + regu_final)
 
     return inverse
 
 
-def _cross_fade(first, second, indices):
+def _cross_fade(first, second, indices, out=None):
     """Cross-fade two numpy arrays by multiplication with a raised cosine
     window inside the range specified by the indices. Outside the range, the
     result will be the respective first or second array, without distortions.
@@ -829,39 +943,70 @@ def _cross_fade(first, second, indices):
     Parameters
     ----------
     first : array, double
-        The first array.
+        The first array. Scalars are broadcasted to the shape of the result.
     second : array, double
-        The second array.
+        The second array. Scalars are broadcasted to the shape of the result.
     indices : array-like, tuple, int
         The lower and upper cross-fade indices.
+    out : array, double, optional
+        Array to which the result is written. It may be `first` or `second`
+        to cross-fade in place. The default ``None`` allocates a new array.
 
     Returns
     -------
     result : array, double
         The resulting array after cross-fading.
     """
+    first = np.asarray(first)
+    second = np.asarray(second)
     indices = np.asarray(indices)
-    if np.shape(first)[-1] != np.shape(second)[-1]:
+    if first.ndim and second.ndim and first.shape[-1] != second.shape[-1]:
         raise ValueError("Both arrays need to be of same length.")
-    len_arrays = np.shape(first)[-1]
-    if np.any(indices > np.shape(first)[-1]):
-        raise IndexError("Index is out of range.")
 
     len_xfade = np.squeeze(np.abs(np.diff(indices)))
-    window = sgn.windows.hann(len_xfade*2 + 1, sym=True)
-    window_rising = window[:len_xfade]
-    window_falling = window[len_xfade+1:]
-
-    window_first = np.concatenate(
-        (np.ones(indices[0]), window_falling, np.zeros(len_arrays-indices[1])))
-    window_second = np.concatenate(
-        (np.zeros(indices[0]), window_rising, np.ones(len_arrays-indices[1])))
+    window_rising, window_falling = _cross_fade_windows(len_xfade)
+
+    # write the first and second array before and after the cross-fade
+    # region and only blend inside the region instead of multiplying both
+    # arrays with full length windows
+    if out is None:
+        result = np.empty(np.broadcast_shapes(first.shape, second.shape),
+                          dtype=np.result_type(first, second, window_rising))
+    else:
+        result = out
+    if np.any(indices > np.shape(result)[-1]):
+        raise IndexError("Index is out of range.")
+    first = np.broadcast_to(first, result.shape)
+    second = np.broadcast_to(second, result.shape)
 
-    result = first * window_first + second * window_second
+    result[..., :indices[0]] = first[..., :indices[0]]
+    result[..., indices[0]:indices[1]] = \
+        first[..., indices[0]:indices[1]] * window_falling + \
+        second[..., indices[0]:indices[1]] * window_rising
+    result[..., indices[1]:] = second[..., indices[1]:]
 
     return result
 
 
+def _cross_fade_windows(len_xfade):
+    """Rising and falling half of a raised cosine window for cross-fading.
+
+    Parameters
+    ----------
+    len_xfade : int
+        The length of the cross-fade in samples.
+
+    Returns
+    -------
+    window_rising : array, double
+        The rising half of the window.
+    window_falling : array, double
+        The falling half of the window.
+    """
+    window = sgn.windows.hann(len_xfade*2 + 1, sym=True)
+    return window[:len_xfade], window[len_xfade+1:]
+
+
 def minimum_phase(signal, n_fft=None, truncate=True):
     """
     Calculate the minimum phase equivalent of a finite impulse response.
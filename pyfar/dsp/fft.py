@@ -2,6 +2,7 @@
 The following documents the FFT functionality. More details and background is
 given in the :py:mod:`FFT concepts <pyfar._concepts.fft>`.
 """
+import functools
 import multiprocessing
 
 import numpy as np
@@ -192,86 +193,135 @@ def normalization(spec, n_samples, sampling_rate, fft_norm='none',
     # check input
     if not isinstance(spec, np.ndarray):
         raise ValueError("Input 'spec' must be a numpy array.")
+
+    norm = _normalization_factor(
+        spec.shape[-1], n_samples, sampling_rate, fft_norm, inverse,
+        single_sided, window)
+
+    # the phase is kept for being able to switch between normalizations
+    # altoug the power spectrum does usually not have phase information,
+    # i.e., spec = np.abs(spec)**2
+    if fft_norm in ["power", "psd"] and not inverse:
+        spec = spec * np.abs(spec)
+
+    # apply normalization
+    spec = spec * norm
+
+    # reverse the squaring in case of 'power' and 'psd' normalization
+    if inverse and fft_norm in ["power", "psd"]:
+        spec /= np.sqrt(np.abs(spec))
+
+    return spec
+
+
+def _normalization_factor(n_bins, n_samples, sampling_rate, fft_norm,
+                          inverse=False, single_sided=True, window=None):
+    """
+    Get the factors for normalizing a Fourier spectrum.
+
+    The factors contain all linear scalings applied by
+    :py:func:`~pyfar.dsp.fft.normalization`. The squaring of the spectrum in
+    case of ``'power'`` and ``'psd'`` normalization is not included.
+
+    Parameters
+    ----------
+    n_bins : int
+        number of frequency bins of the spectrum
+    n_samples, sampling_rate, fft_norm, inverse, single_sided, window
+        See :py:func:`~pyfar.dsp.fft.normalization`.
+
+    Returns
+    -------
+    norm : numpy array
+        The normalization factors with `n_bins` entries. The spectrum is
+        normalized by multiplying it with `norm`.
+    """
+
+    # the window only enters the normalization through its sum, which is
+    # hashable and used for caching the factors
     if window is not None:
         if len(window) != n_samples:
             raise ValueError((f"window must be {n_samples} long "
                               f"but is {len(window)} long."))
+        window = float(np.sum(window))
+
+    norm_edge, norm_inner = _normalization_factor_scalars(
+        n_samples, sampling_rate, fft_norm, bool(inverse), bool(single_sided),
+        window)
+
+    # the bins at 0 Hz and Nyquist (only exists for even n_samples) can
+    # differ from the remaining bins
+    norm = np.full(int(n_bins), norm_inner)
+    norm[:1] = norm_edge
+    if not _is_odd(n_samples):
+        norm[-1:] = norm_edge
+
+    return norm
 
-    n_bins = spec.shape[-1]
-    norm = np.ones(n_bins)
+
+@functools.lru_cache(maxsize=128)
+def _normalization_factor_scalars(n_samples, sampling_rate, fft_norm,
+                                  inverse, single_sided, window_sum):
+    """
+    Cached helper for :py:func:`~_normalization_factor` that takes the sum
+    of the window instead of the window and returns the normalization factors
+    of the bins at 0 Hz and Nyquist and of the remaining bins as scalars.
+    """
+
+    norm = 1.
 
     # account for type of normalization
     if fft_norm == "amplitude":
-        if window is None:
+        if window_sum is None:
             # Equation 4 in Ahrens et al. 2020
             norm /= n_samples
         else:
             # Equation 11 in Ahrens et al. 2020
-            norm /= np.sum(window)
+            norm /= window_sum
     elif fft_norm == 'rms':
         if not single_sided:
             raise ValueError(
                 "'rms' normalization does only exist for single-sided spectra")
-        if window is None:
+        if window_sum is None:
             # Equation 10 in Ahrens et al. 2020
             norm /= n_samples
         else:
             # Equation 11 in Ahrens et al. 2020
-            norm /= np.sum(window)
-        if _is_odd(n_samples):
-            norm[1:] /= np.sqrt(2)
-        else:
-            norm[1:-1] /= np.sqrt(2)
+            norm /= window_sum
     elif fft_norm == 'power':
-        if window is None:
+        if window_sum is None:
             # Equation 5 in Ahrens et al. 2020
             norm /= n_samples**2
         else:
             # Equation 12 in Ahrens et al. 2020
-            norm /= np.sum(window)**2
-        # the phase is kept for being able to switch between normalizations
-        # altoug the power spectrum does usually not have phase information,
-        # i.e., spec = np.abs(spec)**2
-        if not inverse:
-            spec *= np.abs(spec)
+            norm /= window_sum**2
     elif fft_norm == 'psd':
-        if window is None:
+        if window_sum is None:
             # Equation 6 in Ahrens et al. 2020
             norm /= (n_samples * sampling_rate)
         else:
             # Equation 13 in Ahrens et al. 2020
-            norm /= (np.sum(window)**2 * sampling_rate)
-        # the phase is kept for being able to switch between normalizations
-        # altoug the power spectrum does usually not have phase information,
-        # i.e., spec = np.abs(spec)**2
-        if not inverse:
-            spec *= np.abs(spec)
+            norm /= (window_sum**2 * sampling_rate)
     elif fft_norm != 'unitary':
         raise ValueError(("norm type must be 'unitary', 'amplitude', 'rms', "
                           f"'power', or 'psd' but is '{fft_norm}'"))
 
+    norm_edge = norm
+    if fft_norm == 'rms':
+        norm /= np.sqrt(2)
+
     # account for inverse
     if inverse:
+        norm_edge = 1 / norm_edge
         norm = 1 / norm
 
-    # apply normalization
-    spec = spec * norm
-
     # scaling for single sided spectrum, i.e., to account for the lost
     # energy in the discarded half of the spectrum. Only the bins at 0 Hz
     # and Nyquist remain as they are (Equation 8 in Ahrens et al. 2020).
     if single_sided:
-        scale = 2 if not inverse else 1 / 2
-        if _is_odd(n_samples):
-            spec[..., 1:] *= scale
-        else:
-            spec[..., 1:-1] *= scale
+        norm *= 2 if not inverse else 1 / 2
 
-    # reverse the squaring in case of 'power' and 'psd' normalization
-    if inverse and fft_norm in ["power", "psd"]:
-        spec /= np.sqrt(np.abs(spec))
-
-    return spec
+    return norm_edge, norm
 
 
 def _is_odd(num):
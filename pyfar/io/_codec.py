@@ -220,11 +220,9 @@ def _decode_ndarray(obj, zipfile):
     """ This function is exclusively used by `io._inner_decode` and
     decodes `numpy.ndarrays` from a memfile.
     """
-    # Numpy.load is applied on a memory file instead of a physical file
-    memfile = io.BytesIO()
-    nd_bytes = zipfile.read(obj)
-    memfile.write(nd_bytes)
-    memfile.seek(0)
+    # Numpy.load is applied on a memory file instead of a physical file.
+    # The memory file wraps the bytes without copying them.
+    memfile = io.BytesIO(zipfile.read(obj))
     return np.load(memfile, allow_pickle=False)
 
 
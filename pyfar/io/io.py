@@ -10,11 +10,12 @@ data stored in a SOFA file.
 """
 import os.path
 import pathlib
+import functools
+import collections.abc
 
 import warnings
 import sofar as sf
 import zipfile
-import io
 import numpy as np
 import re
 
@@ -32,6 +33,20 @@ from pyfar import Signal, FrequencyData, Coordinates, TimeData
 from . import _codec as codec
 import pyfar.classes.filter as fo
 
+# Size of the blocks in bytes in which audio data is written to disk
+_AUDIO_BLOCK_SIZE = 2**20
+
+# Patterns for parsing the header of COMSOL files, see test files for
+# examples. Patterns that depend on the parameter or domain name are combined
+# with _COMSOL_VALUE_PATTERN and _COMSOL_PARAM_UNIT_PATTERN at runtime.
+_COMSOL_EXP_UNIT_RE = re.compile(r'([\w\(\)\/\^\*. ]+) @')
+_COMSOL_EXP_RE = re.compile(r'([\w\/\^\*\(\)_.]+) \(')
+_COMSOL_UNIT_RE = re.compile(r'\(([\w\/\^\* .]+)\) @')
+_COMSOL_DOMAIN_RE = re.compile(r'@ ([a-zA-Z]+)=')
+_COMSOL_PARAM_RE = re.compile(r'([\w\/\^_.]+)=')
+_COMSOL_VALUE_PATTERN = r'=([0-9.]+)'
+_COMSOL_PARAM_UNIT_PATTERN = r'=[0-9.]+([a-zA-Z]+)'
+
 
 def read_sofa(filename, verify=True):
     """
@@ -155,10 +170,16 @@ def convert_sofa(sofa):
         # order axis according to pyfar convention
         # frequencies go in last dimension)
         if sofa.GLOBAL_DataType == 'TF-E':
-            freq = np.moveaxis(sofa.Data_Real, -1, 0) + \
-                1j * np.moveaxis(sofa.Data_Imag, -1, 0)
+            real = np.moveaxis(sofa.Data_Real, -1, 0)
+            imag = np.moveaxis(sofa.Data_Imag, -1, 0)
         else:
-            freq = sofa.Data_Real + 1j * sofa.Data_Imag
+            real = sofa.Data_Real
+            imag = sofa.Data_Imag
+
+        # fill the complex data directly to avoid temporary arrays
+        freq = np.empty(np.shape(real), dtype=complex)
+        freq.real = real
+        freq.imag = imag
 
         # make FrequencyData
         signal = FrequencyData(freq, sofa.N)
@@ -167,29 +188,32 @@ def convert_sofa(sofa):
             f"DataType {sofa.GLOBAL_DataType} is not supported.")
 
     # Source
-    s_values = sofa.SourcePosition
-    s_domain, s_convention, s_unit = _sofa_pos(sofa.SourcePosition_Type)
-    source_coordinates = Coordinates(
-        s_values[:, 0],
-        s_values[:, 1],
-        s_values[:, 2],
-        domain=s_domain,
-        convention=s_convention,
-        unit=s_unit)
+    source_coordinates = _sofa_coordinates(
+        sofa.SourcePosition, sofa.SourcePosition_Type)
     # Receiver
-    r_values = sofa.ReceiverPosition
-    r_domain, r_convention, r_unit = _sofa_pos(sofa.ReceiverPosition_Type)
-    receiver_coordinates = Coordinates(
-        r_values[:, 0],
-        r_values[:, 1],
-        r_values[:, 2],
-        domain=r_domain,
-        convention=r_convention,
-        unit=r_unit)
+    receiver_coordinates = _sofa_coordinates(
+        sofa.ReceiverPosition, sofa.ReceiverPosition_Type)
 
     return signal, source_coordinates, receiver_coordinates
 
 
+def _sofa_coordinates(values, pos_type):
+    """Create a Coordinates object from a SOFA position and its type."""
+    domain, convention, unit = _sofa_pos(pos_type)
+    # cast the positions once to a C-contiguous float array of shape (3, N),
+    # i.e., each coordinate is a contiguous array instead of a strided column
+    # that is separately cast and read inside Coordinates
+    values = np.ascontiguousarray(np.transpose(values), dtype=np.float64)
+    return Coordinates(
+        values[0],
+        values[1],
+        values[2],
+        domain=domain,
+        convention=convention,
+        unit=unit)
+
+
+@functools.lru_cache(maxsize=None)
 def _sofa_pos(pos_type):
     if pos_type == 'spherical':
         domain = 'sph'
@@ -200,11 +224,11 @@ def _sofa_pos(pos_type):
         convention = 'right'
         unit = 'met'
     else:
-        raise ValueError("Position:Type {pos_type} is not supported.")
+        raise ValueError(f"Position:Type {pos_type} is not supported.")
     return domain, convention, unit
 
 
-def read(filename):
+def read(filename, lazy=False):
     """
     Read any compatible pyfar object or numpy array (.far file) from disk.
 
@@ -212,12 +236,20 @@ def read(filename):
     ----------
     filename : string, Path
         Input file. If no extension is provided, .far-suffix is added.
+    lazy : bool, optional
+        If ``True``, the objects are not decoded when reading the file but
+        only when they are accessed for the first time. This is faster and
+        requires less memory if only some objects of a large file are needed.
+        The file remains open until the returned collection is closed, e.g.,
+        by using it as a context manager (see examples). The default is
+        ``False``.
 
     Returns
     -------
     collection: dict
         Contains pyfar objects like
-        ``{ 'name1': 'obj1', 'name2': 'obj2' ... }``.
+        ``{ 'name1': 'obj1', 'name2': 'obj2' ... }``. If `lazy` is ``True``,
+        a read-only mapping with the same keys is returned.
 
     Examples
     --------
@@ -226,29 +258,25 @@ def read(filename):
     >>> collection = pyfar.read('my_objs.far')
     >>> my_signal = collection['my_signal']
     >>> my_orientations = collection['my_orientations']
+
+    Read only the signal and close the file afterwards
+
+    >>> with pyfar.read('my_objs.far', lazy=True) as collection:
+    >>>     my_signal = collection['my_signal']
     """
     # Check for .far file extension
     filename = pathlib.Path(filename).with_suffix('.far')
 
+    if lazy:
+        return _LazyFarCollection(filename)
+
     collection = {}
+    # the zip file is read directly from the file handle, i.e., only the
+    # parts that are decoded are read from disk
     with open(filename, 'rb') as f:
-        zip_buffer = io.BytesIO()
-        zip_buffer.write(f.read())
-        with zipfile.ZipFile(zip_buffer) as zip_file:
-            zip_paths = zip_file.namelist()
-            obj_names_hints = [
-                path.split('/')[:2] for path in zip_paths if '/$' in path]
-            for name, hint in obj_names_hints:
-                if codec._is_pyfar_type(hint[1:]):
-                    obj = codec._decode_object_json_aided(name, hint, zip_file)
-                elif hint == '$ndarray':
-                    obj = codec._decode_ndarray(f'{name}/{hint}', zip_file)
-                else:
-                    raise TypeError(
-                        '.far-file contains unknown types.'
-                        'This might occur when writing and reading files with'
-                        'different versions of Pyfar.')
-                collection[name] = obj
+        with zipfile.ZipFile(f) as zip_file:
+            for name, hint in _far_object_hints(zip_file):
+                collection[name] = _decode_far_object(name, hint, zip_file)
 
         if 'builtin_wrapper' in collection:
             for key, value in collection['builtin_wrapper'].items():
@@ -258,6 +286,81 @@ def read(filename):
     return collection
 
 
+class _LazyFarCollection(collections.abc.Mapping):
+    """
+    Read-only mapping of the objects in a .far file that are decoded on first
+    access. Returned by :py:func:`read` if ``lazy=True``.
+    """
+
+    def __init__(self, filename):
+        self._file = open(filename, 'rb')
+        try:
+            self._zip_file = zipfile.ZipFile(self._file)
+            self._hints = dict(_far_object_hints(self._zip_file))
+            # builtins are stored in a single object and are decoded
+            # right away to know their names
+            self._cache = {}
+            if 'builtin_wrapper' in self._hints:
+                hint = self._hints.pop('builtin_wrapper')
+                self._cache.update(_decode_far_object(
+                    'builtin_wrapper', hint, self._zip_file))
+        except BaseException:
+            self._file.close()
+            raise
+        self._names = list(self._hints) + \
+            [name for name in self._cache if name not in self._hints]
+
+    def __getitem__(self, name):
+        if name not in self._cache:
+            if name not in self._hints:
+                raise KeyError(name)
+            self._cache[name] = _decode_far_object(
+                name, self._hints[name], self._zip_file)
+        return self._cache[name]
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Close the file. Objects that were not yet accessed are lost."""
+        self._zip_file.close()
+        self._file.close()
+
+
+def _far_object_hints(zip_file):
+    """Return the names and type hints of the objects in a .far file."""
+    # the type hint of an object is stored in the member `name/$hint`.
+    # infolist returns the member infos without copying them
+    hints = {}
+    for info in zip_file.infolist():
+        name, _, hint = info.filename.partition('/')
+        if hint.startswith('$') and name not in hints:
+            hints[name] = hint.partition('/')[0]
+    return list(hints.items())
+
+
+def _decode_far_object(name, hint, zip_file):
+    """Decode a single object from a .far file given its type hint."""
+    if codec._is_pyfar_type(hint[1:]):
+        return codec._decode_object_json_aided(name, hint, zip_file)
+    elif hint == '$ndarray':
+        return codec._decode_ndarray(f'{name}/{hint}', zip_file)
+    else:
+        raise TypeError(
+            '.far-file contains unknown types.'
+            'This might occur when writing and reading files with'
+            'different versions of Pyfar.')
+
+
 def write(filename, compress=False, **objs):
     """
     Write any compatible pyfar object or numpy array and often used builtin
@@ -268,10 +371,13 @@ def write(filename, compress=False, **objs):
     filename : string
         Full path or filename. If now extension is provided, .far-suffix
         will be add to filename.
-    compress : bool
+    compress : bool, int
         Default is ``False`` (uncompressed).
         Compressed files take less disk space but need more time for writing
-        and reading.
+        and reading. ``True`` uses the fastest compression level 1. An
+        integer between 1 and 9 sets the compression level, where higher
+        levels yield smaller files but take considerably more time for
+        writing.
     **objs:
         Objects to be saved as key-value arguments, e.g.,
         ``name1=object1, name2=object2``.
@@ -293,30 +399,49 @@ def write(filename, compress=False, **objs):
     """
     # Check for .far file extension
     filename = pathlib.Path(filename).with_suffix('.far')
-    compression = zipfile.ZIP_STORED if compress else zipfile.ZIP_DEFLATED
-    zip_buffer = io.BytesIO()
+    if compress is True:
+        compress = 1
+    elif compress is not False and not (
+            isinstance(compress, int) and 1 <= compress <= 9):
+        raise ValueError(
+            "compress must be a bool or an integer between 1 and 9 but is "
+            f"{compress}")
+    compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+    compresslevel = compress if compress else None
     builtin_wrapper = codec.BuiltinsWrapper()
-    with zipfile.ZipFile(zip_buffer, "a", compression) as zip_file:
-        for name, obj in objs.items():
-            if codec._is_pyfar_type(obj):
-                codec._encode_object_json_aided(obj, name, zip_file)
-            elif codec._is_numpy_type(obj):
-                codec._encode({f'${type(obj).__name__}': obj}, name, zip_file)
-            elif type(obj) in codec._supported_builtin_types():
-                builtin_wrapper[name] = obj
-            else:
-                error = (
-                    f'Objects of type {type(obj)} cannot be written to disk.')
-                if isinstance(obj, fo.Filter):
-                    error = f'{error}. Consider casting to {fo.Filter}'
-                raise TypeError(error)
-
-        if len(builtin_wrapper) > 0:
-            codec._encode_object_json_aided(
-                builtin_wrapper, 'builtin_wrapper', zip_file)
-
-    with open(filename, 'wb') as f:
-        f.write(zip_buffer.getvalue())
+    builtin_types = codec._supported_builtin_types()
+    # write to a temporary file that replaces the target file only after
+    # writing succeeded. This streams the data to disk without keeping a copy
+    # of the entire file in memory
+    temp_filename = filename.with_suffix('.far.tmp')
+    f = open(temp_filename, 'wb')
+    try:
+        with f, zipfile.ZipFile(
+                f, "w", compression, compresslevel=compresslevel) as zip_file:
+            for name, obj in objs.items():
+                if codec._is_pyfar_type(obj):
+                    codec._encode_object_json_aided(obj, name, zip_file)
+                elif codec._is_numpy_type(obj):
+                    codec._encode(
+                        {f'${type(obj).__name__}': obj}, name, zip_file)
+                elif type(obj) in builtin_types:
+                    builtin_wrapper[name] = obj
+                else:
+                    error = (
+                        f'Objects of type {type(obj)} cannot be written to '
+                        'disk.')
+                    if isinstance(obj, fo.Filter):
+                        error = f'{error}. Consider casting to {fo.Filter}'
+                    raise TypeError(error)
+
+            if len(builtin_wrapper) > 0:
+                codec._encode_object_json_aided(
+                    builtin_wrapper, 'builtin_wrapper', zip_file)
+    except BaseException:
+        os.remove(temp_filename)
+        raise
+
+    os.replace(temp_filename, filename)
 
 
 def read_audio(filename, dtype='float64', **kwargs):
@@ -362,7 +487,12 @@ def read_audio(filename, dtype='float64', **kwargs):
     data, sampling_rate = soundfile.read(
         file=filename, dtype=dtype, always_2d=True, **kwargs)
 
-    return Signal(data.T, sampling_rate, domain='time')
+    # soundfile returns interleaved data of shape (frames, channels). Store
+    # the channels contiguously, which is the memory layout expected by
+    # operations along the time axis, and convert to float in the same copy
+    data = np.asarray(data.T, dtype=float, order='C')
+
+    return Signal(data, sampling_rate, domain='time')
 
 
 def write_audio(signal, filename, subtype=None, overwrite=True, **kwargs):
@@ -389,13 +519,14 @@ def write_audio(signal, filename, subtype=None, overwrite=True, **kwargs):
         Select wether to overwrite the audio file, if it already exists.
         The default is ``True``.
     **kwargs
-        Other keyword arguments to be passed to :py:func:`soundfile.write`.
+        Other keyword arguments to be passed to :py:class:`soundfile.SoundFile`
+        (same as for :py:func:`soundfile.write`).
 
     Notes
     -----
     * Signals are flattened before writing to disk (e.g. a signal with
       ``cshape = (3, 2)`` will be written to disk as a six channel audio file).
-    * This function is based on :py:func:`soundfile.write`.
+    * This function is based on :py:class:`soundfile.SoundFile`.
     * Except for the subtypes ``'FLOAT'``, ``'DOUBLE'`` and ``'VORBIS'`` ´
       amplitudes larger than +/- 1 are clipped.
 
@@ -418,18 +549,27 @@ def write_audio(signal, filename, subtype=None, overwrite=True, **kwargs):
             "File already exists,"
             "use overwrite option to disable error.")
     else:
-        # Only the subtypes FLOAT, DOUBLE, VORBIS are not clipped,
-        # see _clipped_audio_subtypes()
+        # Only the subtypes FLOAT, DOUBLE, VORBIS are not clipped by
+        # libsndfile
         format = pathlib.Path(filename).suffix[1:]
         if subtype is None:
             subtype = default_audio_subtype(format)
-        if (np.any(data > 1.) and
-                subtype.upper() not in ['FLOAT', 'DOUBLE', 'VORBIS']):
+        # check the subtype first to skip scanning the data if it is not
+        # clipped anyways. The reductions do not allocate a boolean mask of
+        # the size of the data
+        if (subtype.upper() not in ['FLOAT', 'DOUBLE', 'VORBIS'] and
+                (data.max(initial=1.) > 1. or data.min(initial=-1.) < -1.)):
             warnings.warn(
                 f'{format}-files of subtype {subtype} are clipped to +/- 1.')
-        soundfile.write(
-            file=filename, data=data.T, samplerate=sampling_rate,
-            subtype=subtype, **kwargs)
+        # libsndfile requires interleaved data, i.e., the transposed data
+        # must be copied. Writing in blocks avoids copying the entire data at
+        # once
+        n_frames = max(1, _AUDIO_BLOCK_SIZE // (data.shape[0] * data.itemsize))
+        with soundfile.SoundFile(
+                filename, 'w', samplerate=sampling_rate,
+                channels=data.shape[0], subtype=subtype, **kwargs) as f:
+            for start in range(0, data.shape[-1], n_frames):
+                f.write(data[:, start:start + n_frames].T)
 
 
 def audio_formats():
@@ -617,15 +757,16 @@ def read_comsol(filename, expressions=None, parameters=None):
             "Input path must be a .txt, .csv or .dat file"
             f"but is of type {str(suffix)}"))
 
-    # get header
+    # get header, meta data, and data format in a single pass over the file
+    header, is_complex, delimiter, metadata = _read_comsol_header_lines(
+        filename)
     all_expressions, units, all_parameters, domain, domain_data \
-        = read_comsol_header(filename)
+        = _parse_comsol_header(header)
     if 'dB' in units:
         warnings.warn(
             r'The data contains values in dB. Consider to use de-logarithmize '
             r'data, such as sound pressure, if possible. otherwise any '
             r'further processing of the data might lead to erroneous results.')
-    header, is_complex, delimiter = _read_comsol_get_headerline(filename)
 
     # set default variables
     if expressions is None:
@@ -634,33 +775,33 @@ def read_comsol(filename, expressions=None, parameters=None):
         parameters = all_parameters.copy()
 
     # get meta data
-    metadata = _read_comsol_metadata(filename)
     n_dimension = metadata['Dimension']
     n_nodes = metadata['Nodes']
     n_entries = metadata['Expressions']
 
     # read data
-    dtype = complex if is_complex else float
+    dtype = np.complex128 if is_complex else np.float64
     domain_str = domain if domain == 'freq' else 't'
-    raw_data = np.loadtxt(
-        filename, dtype=dtype, comments='%', delimiter=delimiter,
-        converters=lambda s: s.replace('i', 'j'), encoding=None)
+    with open(filename) as f:
+        lines = f
+        if is_complex:
+            # COMSOL uses 'i' for the imaginary unit. Replacing it per line
+            # lets loadtxt parse the values natively instead of calling a
+            # Python converter for every single value
+            lines = (line.replace('i', 'j') for line in f)
+        raw_data = np.loadtxt(
+            lines, dtype=dtype, comments='%', delimiter=delimiter)
     # force raw_data to 2D
     raw_data = np.reshape(raw_data, (n_nodes, n_entries+n_dimension))
 
-    # Define pattern for regular expressions, see test files for examples
-    exp_pattern = r'([\w\/\^\*\(\)_.]+) \('
-    domain_pattern = domain_str + r'=([0-9.]+)'
-    value_pattern = r'=([0-9.]+)'
-
     # read parameter and header data
-    expressions_header = np.array(re.findall(exp_pattern, header))
-    domain_header = np.array(
-        [float(x) for x in re.findall(domain_pattern, header)])
+    expressions_header = np.array(_COMSOL_EXP_RE.findall(header))
+    domain_header = np.array([float(x) for x in re.findall(
+        domain_str + _COMSOL_VALUE_PATTERN, header)])
     parameter_header = dict()
     for key in parameters:
-        parameter_header[key] = np.array(
-            [float(x) for x in re.findall(key+value_pattern, header)])
+        parameter_header[key] = np.array([float(x) for x in re.findall(
+            key + _COMSOL_VALUE_PATTERN, header)])
 
     # final data shape
     final_shape = [n_nodes, len(expressions)]
@@ -678,30 +819,38 @@ def read_comsol(filename, expressions=None, parameters=None):
     for idx, key in enumerate(parameters):
         parameter_pairs[key] = pairs[idx].T.flatten()
 
-    # loop over expressions, domain, parameters
-    # extract the data by comparing with header
-    # first fill the array with temporary shape, then reshape
+    # match the columns of the data with the expressions, parameter pairs,
+    # and domain values by comparing with header. The data is first filled
+    # into an array with temporary shape, then reshaped
+    expression_match = expressions_header == np.array(expressions)[:, None]
+    parameter_match = np.full((temp_shape[2], n_entries), True)
+    for key in parameters:
+        parameter_match &= \
+            parameter_header[key] == parameter_pairs[key][:, None]
+    domain_match = domain_header == np.array(domain_data)[:, None]
+
+    columns = expression_match.any(axis=0) & \
+        parameter_match.any(axis=0) & domain_match.any(axis=0)
+    indices = (expression_match.argmax(axis=0)[columns],
+               parameter_match.argmax(axis=0)[columns],
+               domain_match.argmax(axis=0)[columns])
+
     data_in = raw_data[:, -n_entries:]
     data_out = np.full(temp_shape, np.nan, dtype=dtype)
-    for expression_idx, expression_key in enumerate(expressions):
-        expression_mask = expressions_header == expression_key
-        for parameter_idx in range(temp_shape[2]):
-            parameter_mask = np.full_like(expression_mask, True)
-            for key in parameters:
-                parameter_mask &= parameter_header[key] \
-                    == parameter_pairs[key][parameter_idx]
-            for domain_idx, domain_value in enumerate(domain_data):
-                domain_mask = domain_header == domain_value
-                mask = parameter_mask & domain_mask & expression_mask
-                if any(mask):
-                    data_out[:, expression_idx, parameter_idx, domain_idx] \
-                        = data_in[:, mask].flatten()
-                else:
-                    if parameters == all_parameters:
-                        warnings.warn(
-                            r'Specific combinations is set in the Parametric '
-                            r'Sweep in Comsol. Missing data is filled with '
-                            r'nans.')
+    data_out[:, indices[0], indices[1], indices[2]] = data_in[:, columns]
+
+    # check for combinations that are ambiguous or not contained in the data
+    n_found = np.zeros(temp_shape[1:], dtype=int)
+    np.add.at(n_found, indices, 1)
+    if np.any(n_found > 1):
+        raise ValueError(
+            "The data can not be assigned unambiguously. Values must be "
+            "given for all parameters contained in the file.")
+    if not n_found.all() and parameters == all_parameters:
+        warnings.warn(
+            r'Specific combinations is set in the Parametric '
+            r'Sweep in Comsol. Missing data is filled with '
+            r'nans.')
 
     # reshape data to final shape
     data_out = np.reshape(data_out, final_shape)
@@ -799,28 +948,25 @@ def read_comsol_header(filename):
             f"but is of type {str(suffix)}"))
 
     # read header
-    header, _, _ = _read_comsol_get_headerline(filename)
+    header, _, _, _ = _read_comsol_header_lines(filename)
+
+    return _parse_comsol_header(header)
 
-    # Define pattern for regular expressions, see test files for examples
-    exp_unit_pattern = r'([\w\(\)\/\^\*. ]+) @'
-    exp_pattern = r'([\w\/\^\*\(\)_.]+) \('
-    unit_pattern = r'\(([\w\/\^\* .]+)\) @'
-    domain_pattern = r'@ ([a-zA-Z]+)='
-    value_pattern = r'=([0-9.]+)'
-    param_pattern = r'([\w\/\^_.]+)='
-    param_unit_pattern = r'=[0-9.]+([a-zA-Z]+)'
 
+def _parse_comsol_header(header):
+    """Parse the header line returned by `_read_comsol_header_lines`. See
+    :py:func:`~pyfar.io.read_comsol_header` for the return values."""
     # read expressions
-    expressions_with_unit = re.findall(exp_unit_pattern, header)
-    expressions_all = re.findall(exp_pattern, ';'.join(expressions_with_unit))
+    expressions_with_unit = _COMSOL_EXP_UNIT_RE.findall(header)
+    expressions_all = _COMSOL_EXP_RE.findall(';'.join(expressions_with_unit))
     expressions = _unique_strings(expressions_all)
     # read corresponding units
     exp_idxs = [expressions_all.index(e) for e in expressions]
-    units_all = re.findall(unit_pattern, header)
+    units_all = _COMSOL_UNIT_RE.findall(header)
     units = [units_all[i] for i in exp_idxs]
 
     # read domain data
-    domain_str = re.findall(domain_pattern, header)[0]
+    domain_str = _COMSOL_DOMAIN_RE.findall(header)[0]
     if domain_str == 't':
         domain = 'time'
     elif domain_str == 'freq':
@@ -829,44 +975,24 @@ def read_comsol_header(filename):
         raise ValueError(
             f"Domain can be 'time' or 'freq', but is {domain_str}.")
     domain_data = _unique_strings(
-            re.findall(domain_str + value_pattern, header))
+            re.findall(domain_str + _COMSOL_VALUE_PATTERN, header))
     domain_data = [float(d) for d in domain_data]
 
     # create parameters dict
-    parameter_names = _unique_strings(re.findall(param_pattern, header))
+    parameter_names = _unique_strings(_COMSOL_PARAM_RE.findall(header))
     parameter_names.remove(domain_str)
     parameters = dict()
     for para_name in parameter_names:
         unit = _unique_strings(
-            re.findall(para_name + param_unit_pattern, header))
+            re.findall(para_name + _COMSOL_PARAM_UNIT_PATTERN, header))
         values = _unique_strings(
-            re.findall(para_name + value_pattern, header))
+            re.findall(para_name + _COMSOL_VALUE_PATTERN, header))
         values = [float(v) for v in values]
         parameters[para_name] = [x+unit for x in values] if unit else values
 
     return expressions, units, parameters, domain, domain_data
 
 
-def _read_comsol_metadata(filename):
-    suffix = pathlib.Path(filename).suffix
-    metadata = dict()
-    # loop over meta data lines (starting with %)
-    number_names = ['Dimension', 'Nodes', 'Expressions']
-    with open(filename) as f:
-        for line in f.readlines():
-            if line[0] != '%':
-                break
-            elif any(n in line for n in number_names):
-                # character replacements, splits
-                line = line.lstrip('% ')
-                if suffix == '.csv':
-                    line = line.replace('"', '').split(',')
-                elif suffix in ['.dat', '.txt']:
-                    line = line.replace(',', ';').replace(':', ',').split(',')
-                metadata[line[0]] = int(line[-1])
-    return metadata
-
-
 def _unique_strings(expression_list):
     unique = []
     for e in expression_list:
@@ -875,16 +1001,49 @@ def _unique_strings(expression_list):
     return unique
 
 
-def _read_comsol_get_headerline(filename):
+def _read_comsol_header_lines(filename):
+    """
+    Read all information preceding the data from a COMSOL file.
+
+    The file is read line by line and only until the first data line, i.e.,
+    the meta data, header, and data format are obtained in a single pass
+    without loading the (possibly large) data block into memory.
+
+    Returns
+    -------
+    header : str
+        The last line starting with %, which contains the column names.
+    is_complex : bool
+        ``True`` if the data is complex valued.
+    delimiter : str, None
+        ``','`` for comma separated data, ``None`` otherwise.
+    metadata : dict
+        Number of dimensions, nodes, and expressions.
+    """
+    # .csv files are comma separated, .txt and .dat files use colons between
+    # the name and value of the meta data
+    is_csv = pathlib.Path(filename).suffix == '.csv'
     header = []
+    metadata = dict()
+    number_names = ['Dimension', 'Nodes', 'Expressions']
     with open(filename) as f:
         last_line = []
-        for line in f.readlines():
+        for line in f:
             if not line.startswith('%'):
                 header = last_line
                 break
             last_line = line
+            # meta data lines (starting with %)
+            if any(n in line for n in number_names):
+                # character replacements, splits
+                meta = line.lstrip('% ')
+                if is_csv:
+                    meta = meta.replace('"', '').split(',')
+                else:
+                    meta = meta.replace(',', ';').replace(':', ',').split(',')
+                metadata[meta[0]] = int(meta[-1])
 
+    # the first data line defines the data format
     is_complex = 'i' in line
     delimiter = ',' if ',' in line else None
-    return header, is_complex, delimiter
+    return header, is_complex, delimiter, metadata
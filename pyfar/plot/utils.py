@@ -2,9 +2,21 @@ import matplotlib.style as mpl_style
 import os
 import json
 import contextlib
+import functools
 from . import _utils
 from pyfar.plot._interaction import PlotParameter
 
+# full paths of the pyfar plotstyles
+_PLOTSTYLES = {
+    style: os.path.join(
+        os.path.dirname(__file__), 'plotstyles', f'{style}.mplstyle')
+    for style in ['light', 'dark']}
+
+# pyfar default colors as dict and as HEX strings in the order of the
+# plotstyles
+_COLORS = _utils._default_color_dict()
+_COLORS_HEX = tuple(_COLORS.values())
+
 
 def plotstyle(style='light'):
     """
@@ -30,9 +42,8 @@ def plotstyle(style='light'):
 
     """
 
-    if style in ['light', 'dark']:
-        style = os.path.join(
-            os.path.dirname(__file__), 'plotstyles', f'{style}.mplstyle')
+    if isinstance(style, str) and style in _PLOTSTYLES:
+        style = _PLOTSTYLES[style]
 
     return style
 
@@ -178,17 +189,15 @@ def color(color):
     color_hex : str
         pyfar default color as HEX string
     """
-    color_dict = _utils._default_color_dict()
-    colors = list(color_dict.keys())
     if isinstance(color, str):
-        if color[0] not in colors:
+        if color[0] not in _COLORS:
             raise ValueError((f"color is '{color}' but must be one of the "
-                              f"following {', '.join(colors)}"))
+                              f"following {', '.join(_COLORS)}"))
         else:
             # all colors differ by their first letter
-            color_hex = color_dict[color[0]]
+            color_hex = _COLORS[color[0]]
     elif isinstance(color, int):
-        color_hex = list(color_dict.values())[color % len(colors)]
+        color_hex = _COLORS_HEX[color % len(_COLORS_HEX)]
     else:
         raise ValueError("color is has to be of type str or int.")
     return color_hex
@@ -213,70 +222,99 @@ def shortcuts(show=True):
     """  # noqa: W605 (to ignore \*)
     # Note: The end of the docstring can be generated by calling shortcuts()
 
-    # load short cuts from json file
-    sc = os.path.join(os.path.dirname(__file__), 'shortcuts', 'shortcuts.json')
-    with open(sc, "r") as read_file:
-        short_cuts = json.load(read_file)
+    # load short cuts. The dict is parsed in every call because it is
+    # modified by the callers
+    short_cuts, x_toggle, y_toggle, cm_toggle = _load_shortcuts()
+    short_cuts = json.loads(short_cuts)
 
-    # print list of short cuts
+    # print list of short cuts. The text is collected and printed at once
     if show:
-        # get list of plots that allow toggling axes and colormaps
-        x_toggle = []
-        y_toggle = []
-        cm_toggle = []
-        for plot in short_cuts["plots"]:
-            params = PlotParameter(plot)
-            if params.x_type is not None:
-                if len(params.x_type) > 1:
-                    x_toggle.append(plot)
-            if params.y_type is not None:
-                if len(params.y_type) > 1:
-                    y_toggle.append(plot)
-            if params.cm_type is not None:
-                if len(params.cm_type) > 1:
-                    cm_toggle.append(plot)
-
-        # print information
-        print("Use these shortcuts to show different plots")
-        print("-------------------------------------------")
+        lines = []
+        lines.append("Use these shortcuts to show different plots")
+        lines.append("-------------------------------------------")
         plt = short_cuts["plots"]
         for p in plt:
             if "key_verbose" in plt[p]:
                 key = plt[p]["key_verbose"]
             else:
                 key = plt[p]["key"]
-            print(f'{", ".join(key)}: {p}')
-        print(" ")
-        print(("Note that not all plots are available for TimeData and "
-               "FrequencyData objects as detailed in the documentation of "
-               "plots.\n\n"))
-
-        print("Use these shortcuts to control the plot")
-        print("---------------------------------------")
+            lines.append(f'{", ".join(key)}: {p}')
+        lines.append(" ")
+        lines.append(("Note that not all plots are available for TimeData and "
+                      "FrequencyData objects as detailed in the documentation "
+                      "of plots.\n\n"))
+
+        lines.append("Use these shortcuts to control the plot")
+        lines.append("---------------------------------------")
         ctr = short_cuts["controls"]
         for action in ctr:
             if "key_verbose" in ctr[action]:
                 key = ctr[action]["key_verbose"]
             else:
                 key = ctr[action]["key"]
-            print(f'{", ".join(key)}: {ctr[action]["info"]}')
-        print(" ")
-
-        print("Notes on plot controls")
-        print("----------------------")
-        print("Moving and zooming the x and y axes is supported by all plots.")
-        print(" ")
-        print(("Moving and zooming the colormap is only supported by plots "
-               "that have a colormap."))
-        print(" ")
-        print(f"Toggling the x-axis is supported by: {', '.join(x_toggle)}")
-        print(" ")
-        print(f"Toggling the y-axis is supported by: {', '.join(y_toggle)}")
-        print(" ")
-        print(f"Toggling the colormap is supported by: {', '.join(cm_toggle)}")
-        print(" ")
-        print(("Toggling between line and 2D plots is not supported by:"
-               " spectrogram"))
-        print(" ")
+            lines.append(f'{", ".join(key)}: {ctr[action]["info"]}')
+        lines.append(" ")
+
+        lines.append("Notes on plot controls")
+        lines.append("----------------------")
+        lines.append(
+            "Moving and zooming the x and y axes is supported by all plots.")
+        lines.append(" ")
+        lines.append(("Moving and zooming the colormap is only supported by "
+                      "plots that have a colormap."))
+        lines.append(" ")
+        lines.append(
+            f"Toggling the x-axis is supported by: {', '.join(x_toggle)}")
+        lines.append(" ")
+        lines.append(
+            f"Toggling the y-axis is supported by: {', '.join(y_toggle)}")
+        lines.append(" ")
+        lines.append(
+            f"Toggling the colormap is supported by: {', '.join(cm_toggle)}")
+        lines.append(" ")
+        lines.append(("Toggling between line and 2D plots is not supported "
+                      "by: spectrogram"))
+        lines.append(" ")
+
+        print("\n".join(lines))
 
     return short_cuts
+
+
+@functools.lru_cache(maxsize=1)
+def _load_shortcuts():
+    """
+    Read the shortcuts file and get the plots that allow toggling axes and
+    colormaps.
+
+    Returns
+    -------
+    short_cuts : bytes
+        Content of the json file containing the shortcuts.
+    x_toggle, y_toggle, cm_toggle : tuple
+        Names of the plots that allow toggling the x-axis, y-axis, and
+        colormap.
+    """
+    # load short cuts from json file. The raw bytes are passed to json,
+    # which detects the encoding itself
+    sc = os.path.join(os.path.dirname(__file__), 'shortcuts', 'shortcuts.json')
+    with open(sc, "rb") as read_file:
+        short_cuts = read_file.read()
+
+    # get list of plots that allow toggling axes and colormaps
+    x_toggle = []
+    y_toggle = []
+    cm_toggle = []
+    for plot in json.loads(short_cuts)["plots"]:
+        # toggling requires more than one type (see PlotParameter.toggle_x)
+        params = PlotParameter(plot)
+        x_types, y_types, cm_types = \
+            params._x_type, params._y_type, params._cm_type
+        if x_types is not None and len(x_types) > 1:
+            x_toggle.append(plot)
+        if y_types is not None and len(y_types) > 1:
+            y_toggle.append(plot)
+        if cm_types is not None and len(cm_types) > 1:
+            cm_toggle.append(plot)
+
+    return short_cuts, tuple(x_toggle), tuple(y_toggle), tuple(cm_toggle)
@@ -55,7 +55,7 @@ def sine(frequency, n_samples, amplitude=1, phase=0, sampling_rate=44100,
     # generate the sine signal
     n_samples = int(n_samples)
     times = np.arange(n_samples) / sampling_rate
-    sine = np.zeros(cshape + (n_samples, ))
+    sine = np.empty(cshape + (n_samples, ))
     for idx in np.ndindex(cshape):
         if full_period:
             # nearest number of full periods
@@ -64,8 +64,13 @@ def sine(frequency, n_samples, amplitude=1, phase=0, sampling_rate=44100,
             # corresponding frequency
             frequency[idx] = num_periods * sampling_rate / n_samples
 
-        sine[idx] = amplitude[idx] * \
-            np.sin(2 * np.pi * frequency[idx] * times + phase[idx])
+        # amplitude * sin(2 pi f t + phase) computed in place to avoid
+        # temporary arrays
+        channel = sine[idx]
+        np.multiply(2 * np.pi * frequency[idx], times, out=channel)
+        channel += phase[idx]
+        np.sin(channel, out=channel)
+        channel *= amplitude[idx]
 
     # save to Signal
     nl = "\n"  # required as variable because f-strings cannot contain "\"
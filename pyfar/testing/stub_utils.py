@@ -6,6 +6,7 @@ objects as input arguments. This makes testing such functions independent from
 the pyfar objects themselves and helps to find bugs.
 """
 import numpy as np
+from scipy import fft
 import deepdiff
 from copy import deepcopy
 from unittest import mock
@@ -60,8 +61,7 @@ def signal_stub(time, freq, sampling_rate, fft_norm):
             bin[idx] = np.argmin(np.abs(signal.frequencies-freq))
         return bin
 
-    signal = mock.MagicMock(
-        spec_set=Signal(time, sampling_rate, domain='time'))
+    signal = mock.MagicMock(spec_set=Signal)
     signal.time = np.atleast_2d(time)
     signal.freq = np.atleast_2d(freq)
     signal.sampling_rate = sampling_rate
@@ -72,7 +72,7 @@ def signal_stub(time, freq, sampling_rate, fft_norm):
     signal.times = np.atleast_1d(
         np.arange(0, signal.n_samples) / sampling_rate)
     signal.frequencies = np.atleast_1d(
-        np.fft.rfftfreq(signal.n_samples, 1 / sampling_rate))
+        fft.rfftfreq(signal.n_samples, 1 / sampling_rate))
     signal.__getitem__.side_effect = getitem
     signal.find_nearest_time = find_nearest_time
     signal.find_nearest_frequency = find_nearest_frequency
@@ -105,8 +105,7 @@ def time_data_stub(time, times):
         item = time_data_stub(time, time_data.times)
         return item
 
-    time_data = mock.MagicMock(
-        spec_set=TimeData(time, times))
+    time_data = mock.MagicMock(spec_set=TimeData)
     time_data.time = np.atleast_2d(time)
     time_data.times = np.atleast_1d(times)
     time_data.domain = 'time'
@@ -143,8 +142,7 @@ def frequency_data_stub(freq, frequencies):
         item = frequency_data_stub(freq, frequency_data.frequencies)
         return item
 
-    frequency_data = mock.MagicMock(
-        spec_set=FrequencyData(freq, frequencies))
+    frequency_data = mock.MagicMock(spec_set=FrequencyData)
     frequency_data.freq = np.atleast_2d(freq)
     frequency_data.frequencies = np.atleast_1d(frequencies)
     frequency_data.domain = 'freq'
@@ -277,7 +275,7 @@ def noise_func(sigma, n_samples, cshape):
     np.random.seed(1000)
     # Time vector
     time = np.random.normal(0, sigma, (cshape + (n_samples,)))
-    freq = np.fft.rfft(time)
+    freq = fft.rfft(time)
     norm = 1 / n_samples / np.sqrt(2) * 2
     freq *= norm
 
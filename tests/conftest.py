@@ -1,6 +1,8 @@
 import pytest
 import numpy as np
 import os.path
+import copy
+import functools
 import sofar as sf
 import pyfar as pf
 
@@ -92,6 +94,15 @@ def impulse_stub():
     return signal
 
 
+@functools.lru_cache(maxsize=None)
+def _noise_func(sigma, n_samples, cshape):
+    """Cached and read-only output of ``stub_utils.noise_func``."""
+    time, freq = stub_utils.noise_func(sigma, n_samples, cshape)
+    time.setflags(write=False)
+    freq.setflags(write=False)
+    return time, freq
+
+
 @pytest.fixture
 def noise_stub():
     """Gaussian white noise signal stub.
@@ -110,7 +121,7 @@ def noise_stub():
     sampling_rate = 44100
     fft_norm = 'rms'
 
-    time, freq = stub_utils.noise_func(sigma, n_samples, cshape)
+    time, freq = _noise_func(sigma, n_samples, cshape)
     signal = stub_utils.signal_stub(
         time, freq, sampling_rate, fft_norm)
 
@@ -135,22 +146,16 @@ def noise_stub_odd():
     sampling_rate = 44100
     fft_norm = 'rms'
 
-    time, freq = stub_utils.noise_func(sigma, n_samples, cshape)
+    time, freq = _noise_func(sigma, n_samples, cshape)
     signal = stub_utils.signal_stub(
         time, freq, sampling_rate, fft_norm)
 
     return signal
 
 
-@pytest.fixture
-def sine():
-    """Sine signal.
-
-    Returns
-    -------
-    signal : Signal
-        Sine signal
-    """
+@functools.lru_cache(maxsize=None)
+def _sine():
+    """Cached template of :py:func:`sine`."""
     frequency = 441
     n_samples = 10000
     sampling_rate = 44100
@@ -163,6 +168,20 @@ def sine():
     return signal
 
 
+@pytest.fixture
+def sine():
+    """Sine signal.
+
+    Returns
+    -------
+    signal : Signal
+        Sine signal
+    """
+    # copy, because the getters of Signal objects can change the
+    # domain and data of the template in place
+    return _sine().copy()
+
+
 @pytest.fixture
 def sine_short():
     """Short sine signal where the first frequency is > 20 Hz.
@@ -186,15 +205,9 @@ def sine_short():
     return signal
 
 
-@pytest.fixture
-def impulse():
-    """Delta impulse signal.
-
-    Returns
-    -------
-    signal : Signal
-        Impulse signal
-    """
+@functools.lru_cache(maxsize=None)
+def _impulse():
+    """Cached template of :py:func:`impulse`."""
     n_samples = 10000
     delay = 0
     amplitude = 1
@@ -208,16 +221,71 @@ def impulse():
 
 
 @pytest.fixture
-def impulse_group_delay():
-    """Delayed delta impulse signal with analytical group delay.
+def impulse():
+    """Delta impulse signal.
 
     Returns
     -------
     signal : Signal
         Impulse signal
-    group_delay : ndarray
-        Group delay of impulse signal
     """
+    # copy, because the getters of Signal objects can change the
+    # domain and data of the template in place
+    return _impulse().copy()
+
+
+# session scope, tests must not modify the returned objects in place
+@pytest.fixture(scope='session')
+def make_signal():
+    """Factory for Signals with overwritten private attributes.
+
+    Returns
+    -------
+    make : callable
+        ``make(**attributes)`` returns a shallow copy of
+        ``Signal([1, 2, 3], 44100, domain='time')`` and sets the private
+        attribute ``'_' + key`` to each given value, e.g., ``make(data=data)``
+        sets ``_data``. Attributes of the returned Signal must be replaced and
+        not modified in place.
+    """
+    template = pyfar.Signal([1, 2, 3], 44100, domain='time')
+
+    def make(**attributes):
+        signal = copy.copy(template)
+        for key, value in attributes.items():
+            setattr(signal, '_' + key, value)
+        return signal
+
+    return make
+
+
+@pytest.fixture(scope='module')
+def ones_signal_factory():
+    """Factory for signals containing only ones.
+
+    Returns
+    -------
+    make : callable
+        ``make(n_samples, sampling_rate)`` returns a single channel Signal of
+        ones. Signals are cached per module for each combination of
+        `n_samples` and `sampling_rate` and a copy is returned.
+    """
+    cache = {}
+
+    def make(n_samples, sampling_rate):
+        key = (n_samples, sampling_rate)
+        if key not in cache:
+            cache[key] = pyfar.Signal(np.ones(n_samples), sampling_rate)
+        # copy, because the getters of Signal objects can change the
+        # domain and data of the cached signal in place
+        return cache[key].copy()
+
+    return make
+
+
+@functools.lru_cache(maxsize=None)
+def _impulse_group_delay():
+    """Cached template of :py:func:`impulse_group_delay`."""
     n_samples = 10000
     delay = 0
     amplitude = 1
@@ -232,8 +300,8 @@ def impulse_group_delay():
 
 
 @pytest.fixture
-def impulse_group_delay_two_channel():
-    """Delayed 2 channel delta impulse signal with analytical group delay.
+def impulse_group_delay():
+    """Delayed delta impulse signal with analytical group delay.
 
     Returns
     -------
@@ -242,6 +310,15 @@ def impulse_group_delay_two_channel():
     group_delay : ndarray
         Group delay of impulse signal
     """
+    # copy, because the getters of Signal objects can change the
+    # domain and data of the template in place
+    signal, group_delay = _impulse_group_delay()
+    return signal.copy(), group_delay.copy()
+
+
+@functools.lru_cache(maxsize=None)
+def _impulse_group_delay_two_channel():
+    """Cached template of :py:func:`impulse_group_delay_two_channel`."""
     n_samples = 10000
     delay = np.atleast_1d([1000, 2000])
     amplitude = np.atleast_1d([1, 1])
@@ -257,8 +334,8 @@ def impulse_group_delay_two_channel():
 
 
 @pytest.fixture
-def impulse_group_delay_two_by_two_channel():
-    """Delayed 2-by-2 channel delta impulse signal with analytical group delay.
+def impulse_group_delay_two_channel():
+    """Delayed 2 channel delta impulse signal with analytical group delay.
 
     Returns
     -------
@@ -267,6 +344,15 @@ def impulse_group_delay_two_by_two_channel():
     group_delay : ndarray
         Group delay of impulse signal
     """
+    # copy, because the getters of Signal objects can change the
+    # domain and data of the template in place
+    signal, group_delay = _impulse_group_delay_two_channel()
+    return signal.copy(), group_delay.copy()
+
+
+@functools.lru_cache(maxsize=None)
+def _impulse_group_delay_two_by_two_channel():
+    """Cached template of :py:func:`impulse_group_delay_two_by_two_channel`."""
     n_samples = 10000
     delay = np.array([[1000, 2000], [3000, 4000]])
     amplitude = np.atleast_1d([[1, 1], [1, 1]])
@@ -282,14 +368,25 @@ def impulse_group_delay_two_by_two_channel():
 
 
 @pytest.fixture
-def sine_plus_impulse():
-    """Added sine and delta impulse signals.
+def impulse_group_delay_two_by_two_channel():
+    """Delayed 2-by-2 channel delta impulse signal with analytical group delay.
 
     Returns
     -------
     signal : Signal
-        Combined signal
+        Impulse signal
+    group_delay : ndarray
+        Group delay of impulse signal
     """
+    # copy, because the getters of Signal objects can change the
+    # domain and data of the template in place
+    signal, group_delay = _impulse_group_delay_two_by_two_channel()
+    return signal.copy(), group_delay.copy()
+
+
+@functools.lru_cache(maxsize=None)
+def _sine_plus_impulse():
+    """Cached template of :py:func:`sine_plus_impulse`."""
     frequency = 441
     delay = 100
     n_samples = 10000
@@ -309,6 +406,20 @@ def sine_plus_impulse():
     return signal
 
 
+@pytest.fixture
+def sine_plus_impulse():
+    """Added sine and delta impulse signals.
+
+    Returns
+    -------
+    signal : Signal
+        Combined signal
+    """
+    # copy, because the getters of Signal objects can change the
+    # domain and data of the template in place
+    return _sine_plus_impulse().copy()
+
+
 @pytest.fixture
 def noise():
     """Gaussian white noise signal.
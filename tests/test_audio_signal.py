@@ -5,6 +5,10 @@ import pytest
 from pyfar import Signal
 import pyfar as pf
 
+# read-only multichannel time data shared by the tests
+_TIME_3D = np.arange(2 * 3 * 4).reshape((2, 3, 4))
+_TIME_3D.setflags(write=False)
+
 
 def test_signal_init():
     """Test to init Signal without optional parameters."""
@@ -26,17 +30,14 @@ def test_signal_init_default_parameter():
     assert signal.fft_norm == 'none'
 
 
-def test_signal_init_assertions():
+@pytest.mark.parametrize("kwargs,match", [
+    ({"fft_norm": "funky"}, "Invalid FFT normalization"),
+    ({"domain": "freq", "n_samples": 10}, "n_samples can not be larger"),
+    ({"domain": "space"}, "Invalid domain")])
+def test_signal_init_assertions(kwargs, match):
     """Test assertions in initialization"""
-
-    with pytest.raises(ValueError, match="Invalid FFT normalization"):
-        Signal(1, 44100, fft_norm="funky")
-
-    with pytest.raises(ValueError, match="n_samples can not be larger"):
-        Signal(1, 44100, domain="freq", n_samples=10)
-
-    with pytest.raises(ValueError, match="Invalid domain"):
-        Signal(1, 44100, domain="space")
+    with pytest.raises(ValueError, match=match):
+        Signal(1, 44100, **kwargs)
 
 
 def test_signal_init_time_dtype():
@@ -171,30 +172,42 @@ def test_n_bins():
 def test_times():
     """Test for the time instances."""
     signal = Signal([1, 2, 3, 4], 2, domain='time')
-    npt.assert_allclose(signal.times, [0., 0.5, 1., 1.5])
+    npt.assert_array_equal(signal.times, [0., 0.5, 1., 1.5])
 
 
-def test_getter_time():
-    """Test if attribute time is accessed correctly."""
-    signal = Signal([1, 2, 3], 44100, domain='time')
-    signal._domain = 'time'
-    signal._data = np.array([[1., 2., 3.]])
-    npt.assert_allclose(signal.time, np.array([[1., 2., 3.]]))
+# read-only time data for the getter and setter tests
+_TIME = np.array([1., 2., 3.])
+_TIME.setflags(write=False)
+_TIME_2D = np.array([[1., 2., 3.]])
+_TIME_2D.setflags(write=False)
 
 
-def test_setter_time():
-    """Test if attribute time is set correctly."""
+@pytest.mark.parametrize("attribute,private,stored", [
+    ('time', '_data', _TIME_2D),
+    ('sampling_rate', '_sampling_rate', 1000)])
+def test_getter(make_signal, attribute, private, stored):
+    """Test if time and sampling rate are accessed correctly."""
+    signal = make_signal()
+    setattr(signal, private, stored)
+    npt.assert_array_equal(getattr(signal, attribute), stored)
+
+
+@pytest.mark.parametrize("attribute,private,value,stored", [
+    ('time', '_data', _TIME, _TIME_2D),
+    ('sampling_rate', '_sampling_rate', 1000, 1000)])
+def test_setter(attribute, private, value, stored):
+    """Test if time and sampling rate are set correctly."""
     signal = Signal([1, 2, 3], 44100, domain='time')
-    signal.time = np.array([1., 2., 3.])
+    setattr(signal, attribute, value)
     assert signal._domain == 'time'
-    npt.assert_allclose(signal._data, np.array([[1., 2., 3.]]))
+    npt.assert_array_equal(getattr(signal, private), stored)
 
 
-def test_getter_freq():
+def test_getter_freq(make_signal):
     """Test if attribute freq is accessed correctly."""
-    signal = Signal([1, 2, 3, 4], 44100, fft_norm='amplitude')
-    signal._domain = 'freq'
-    signal._data = np.array([[1., 2., 3.]])
+    signal = make_signal(
+        domain='freq', data=np.array([[1., 2., 3.]]), n_samples=4,
+        fft_norm='amplitude')
     desired = np.array([[1., 2*2, 3.]]) / signal.n_samples
     npt.assert_allclose(signal.freq, desired)
 
@@ -216,27 +229,12 @@ def test_re_setter_freq():
         signal.freq = [1, 2, 3, 4]
 
 
-def test_getter_sampling_rate():
-    """Test if attribute sampling rate is accessed correctly."""
-    signal = Signal([1, 2, 3], 44100)
-    signal._sampling_rate = 1000
-    assert signal.sampling_rate == 1000
-
-
-def test_setter_sampligrate():
-    """Test if attribute sampling rate is set correctly."""
-    signal = Signal([1, 2, 3], 44100)
-    signal.sampling_rate = 1000
-    assert signal._sampling_rate == 1000
-
-
-def test_getter_signal_type():
+@pytest.mark.parametrize("fft_norm,signal_type", [
+    ('none', 'energy'), ('rms', 'power')])
+def test_getter_signal_type(fft_norm, signal_type):
     """Test if attribute signal type is accessed correctly."""
-    signal = Signal([1, 2, 3], 44100, fft_norm='none')
-    npt.assert_string_equal(signal.signal_type, 'energy')
-
-    signal = Signal([1, 2, 3], 44100, fft_norm='rms')
-    npt.assert_string_equal(signal.signal_type, 'power')
+    signal = Signal([1, 2, 3], 44100, fft_norm=fft_norm)
+    npt.assert_string_equal(signal.signal_type, signal_type)
 
 
 def test_getter_fft_norm():
@@ -285,30 +283,16 @@ def test_signal_length():
 
 def test_cshape():
     """Test the attribute cshape."""
-    time = np.arange(2 * 3 * 4).reshape((2, 3, 4))
-    signal = Signal(time, 44100)
+    signal = Signal(_TIME_3D, 44100)
     assert signal.cshape == (2, 3)
 
 
-def test_magic_getitem():
-    """Test slicing operations by the magic function __getitem__."""
-    time = np.arange(2 * 3 * 4).reshape((2, 3, 4))
-    signal = Signal(time, 44100, domain='time')
-    npt.assert_allclose(signal[0]._data, time[0])
-
-
-def test_magic_getitem_slice():
-    """Test slicing operations by the magic function __getitem__."""
-    time = np.arange(2 * 3 * 4).reshape((2, 3, 4))
-    signal = Signal(time, 44100, domain='time')
-    npt.assert_allclose(signal[:1]._data, time[:1])
-
-
-def test_magic_getitem_allslice():
+@pytest.mark.parametrize("index", [
+    np.index_exp[0], np.index_exp[:1], np.index_exp[:]])
+def test_magic_getitem(index):
     """Test slicing operations by the magic function __getitem__."""
-    time = np.arange(2 * 3 * 4).reshape((2, 3, 4))
-    signal = Signal(time, 44100, domain='time')
-    npt.assert_allclose(signal[:]._data, time[:])
+    signal = Signal(_TIME_3D, 44100, domain='time')
+    npt.assert_array_equal(signal[index]._data, _TIME_3D[index])
 
 
 def test_magic_setitem():
@@ -316,7 +300,7 @@ def test_magic_setitem():
     signal = Signal([1, 2, 3], 44100)
     set_signal = Signal([2, 3, 4], 44100)
     signal[0] = set_signal
-    npt.assert_allclose(signal._data, set_signal._data)
+    npt.assert_array_equal(signal._data, set_signal._data)
 
 
 def test_magic_setitem_wrong_sr():
@@ -439,15 +423,14 @@ def test___eq___equal():
 
 
 def test___eq___notEqual():
-    time = np.arange(2*3*4).reshape((2, 3, 4))
-    signal = Signal(time, 44100, domain='time')
+    signal = Signal(_TIME_3D, 44100, domain='time')
 
-    actual = Signal(0.5 * time, 44100, domain='time')
+    actual = Signal(0.5 * _TIME_3D, 44100, domain='time')
     assert not signal == actual
-    actual = Signal(time, 2 * 44100, domain='time')
+    actual = Signal(_TIME_3D, 2 * 44100, domain='time')
     assert not signal == actual
     comment = f'{signal.comment} A completely different thing'
-    actual = Signal(time, 44100, domain='time', comment=comment)
+    actual = Signal(_TIME_3D, 44100, domain='time', comment=comment)
     assert not signal == actual
 
 
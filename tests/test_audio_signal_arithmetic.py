@@ -7,6 +7,10 @@ import pyfar as pf
 import pyfar.classes.audio as signal
 from pyfar import Signal, TimeData, FrequencyData
 
+# read-only reference for checking that the [1, 0, 0] inputs did not change
+_IMPULSE_2D = np.atleast_2d([1, 0, 0])
+_IMPULSE_2D.setflags(write=False)
+
 
 # test adding two Signals
 def test_add_two_signals_time():
@@ -16,7 +20,7 @@ def test_add_two_signals_time():
     # time domain
     y = pf.add((x, x), 'time')
     # check if old signal did not change
-    npt.assert_allclose(x.time, np.atleast_2d([1, 0, 0]), atol=1e-15)
+    npt.assert_allclose(x.time, _IMPULSE_2D, atol=1e-15)
     # check result
     assert isinstance(y, Signal)
     assert y.domain == 'time'
@@ -31,7 +35,7 @@ def test_add_two_signals_freq():
     # frequency domain
     y = pf.add((x, x), 'freq')
     # check if old signal did not change
-    npt.assert_allclose(x.time, np.atleast_2d([1, 0, 0]), atol=1e-15)
+    npt.assert_allclose(x.time, _IMPULSE_2D, atol=1e-15)
     # check result
     assert isinstance(y, Signal)
     assert y.domain == 'freq'
@@ -45,7 +49,7 @@ def test_add_three_signals():
     y = pf.add((x, x, x), 'time')
 
     # check if old signal did not change
-    npt.assert_allclose(x.time, np.atleast_2d([1, 0, 0]), atol=1e-15)
+    npt.assert_allclose(x.time, _IMPULSE_2D, atol=1e-15)
 
     # check result
     assert isinstance(y, Signal)
@@ -60,7 +64,7 @@ def test_add_signal_and_number():
     y = pf.add((x, 1), 'time')
 
     # check if old signal did not change
-    npt.assert_allclose(x.time, np.atleast_2d([1, 0, 0]), atol=1e-15)
+    npt.assert_allclose(x.time, _IMPULSE_2D, atol=1e-15)
 
     # check result
     assert isinstance(y, Signal)
@@ -75,7 +79,7 @@ def test_add_number_and_signal():
     y = pf.add((1, x), 'time')
 
     # check if old signal did not change
-    npt.assert_allclose(x.time, np.atleast_2d([1, 0, 0]), atol=1e-15)
+    npt.assert_allclose(x.time, _IMPULSE_2D, atol=1e-15)
 
     # check result
     assert isinstance(y, Signal)
@@ -89,7 +93,7 @@ def test_add_time_data_and_number():
     y = pf.add((x, 1), 'time')
 
     # check if old signal did not change
-    npt.assert_allclose(x.time, np.atleast_2d([1, 0, 0]), atol=1e-15)
+    npt.assert_allclose(x.time, _IMPULSE_2D, atol=1e-15)
     npt.assert_allclose(x.times, np.atleast_1d([0, .1, .5]), atol=1e-15)
 
     # check result
@@ -104,7 +108,7 @@ def test_add_time_data_and_time_data():
     y = pf.add((x, x), 'time')
 
     # check if old signal did not change
-    npt.assert_allclose(x.time, np.atleast_2d([1, 0, 0]), atol=1e-15)
+    npt.assert_allclose(x.time, _IMPULSE_2D, atol=1e-15)
     npt.assert_allclose(x.times, np.atleast_1d([0, .1, .5]), atol=1e-15)
 
     # check result
@@ -136,7 +140,7 @@ def test_add_frequency_data_and_number():
         pf.add((x, 1), 'time')
 
     # check if old signal did not change
-    npt.assert_allclose(x.freq, np.atleast_2d([1, 0, 0]), atol=1e-15)
+    npt.assert_allclose(x.freq, _IMPULSE_2D, atol=1e-15)
     npt.assert_allclose(x.frequencies, np.atleast_1d([0, .1, .5]), atol=1e-15)
 
     # check result
@@ -151,7 +155,7 @@ def test_add_frequency_data_and_frequency_data():
     y = pf.add((x, x), 'freq')
 
     # check if old signal did not change
-    npt.assert_allclose(x.freq, np.atleast_2d([1, 0, 0]), atol=1e-15)
+    npt.assert_allclose(x.freq, _IMPULSE_2D, atol=1e-15)
     npt.assert_allclose(x.frequencies, np.atleast_1d([0, .1, .5]), atol=1e-15)
 
     # check result
@@ -2,7 +2,6 @@ import numpy as np
 import numpy.testing as npt
 import pytest
 from pytest import raises
-import matplotlib.pyplot as plt
 
 from pyfar import Coordinates
 import pyfar.classes.coordinates as coordinates
@@ -255,6 +254,7 @@ def test_coordinates_init_sh_order():
 
 def test_show():
     """Test if possible calls of show() pass."""
+    import matplotlib.pyplot as plt
     coords = Coordinates([-1, 0, 1], 0, 0)
     # show without mask
     coords.show()
@@ -466,6 +466,7 @@ def test_getitem():
 
 def test_find_nearest_k():
     """Test returns of find_nearest_k"""
+    import matplotlib.pyplot as plt
     # 1D cartesian, nearest point
     x = np.arange(6)
     coords = Coordinates(x, 0, 0)
@@ -556,6 +557,7 @@ def test_find_nearest_sph():
 
 def test_find_slice():
     """Test different queries for find slice."""
+    import matplotlib.pyplot as plt
     # test only for self.cdim = 1.
     # self.find_slice uses KDTree, which is tested with N-dimensional arrays
     # in test_find_nearest_k()
@@ -9,31 +9,19 @@ from pyfar import dsp
 import pyfar as pf
 
 
-def test_phase_rad(sine_plus_impulse):
-    """Test the function returning the phase of a signal in radians."""
-    phase = dsp.phase(sine_plus_impulse, deg=False, unwrap=False)
+@pytest.mark.parametrize("deg,unwrap", [
+    (False, False), (True, False), (False, True), (True, True)])
+def test_phase(sine_plus_impulse, deg, unwrap):
+    """Test the function returning the phase of a signal in radians and
+    degrees with and without unwrapping."""
+    phase = dsp.phase(sine_plus_impulse, deg=deg, unwrap=unwrap)
     truth = np.angle(sine_plus_impulse.freq)
-    npt.assert_allclose(phase, truth, rtol=1e-10)
-
-
-def test_phase_deg(sine_plus_impulse):
-    """Test the function returning the phase of a signal in degrees."""
-    phase = dsp.phase(sine_plus_impulse, deg=True, unwrap=False)
-    truth = np.degrees(np.angle(sine_plus_impulse.freq))
-    npt.assert_allclose(phase, truth, rtol=1e-10)
-
-
-def test_phase_unwrap(sine_plus_impulse):
-    """Test the function returning the unwrapped phase of a signal."""
-    phase = dsp.phase(sine_plus_impulse, deg=False, unwrap=True)
-    truth = np.unwrap(np.angle(sine_plus_impulse.freq))
-    npt.assert_allclose(phase, truth, rtol=1e-10)
-
-
-def test_phase_deg_unwrap(sine_plus_impulse):
-    """Test the function returning the unwrapped phase of a signal in deg."""
-    phase = dsp.phase(sine_plus_impulse, deg=True, unwrap=True)
-    truth = np.degrees(np.unwrap(np.angle(sine_plus_impulse.freq)))
+    if unwrap:
+        # unwrap in units of turns to keep the reference tight
+        tau = 2 * np.pi
+        truth = np.unwrap(truth / tau, period=1.0) * tau
+    if deg:
+        truth = np.degrees(truth)
     npt.assert_allclose(phase, truth, rtol=1e-10)
 
 
@@ -111,6 +99,49 @@ def test_group_delay_custom_frequencies(impulse_group_delay):
         grp, impulse_group_delay[1][0, frequency_idx], atol=1e-10)
 
 
+def test_group_delay_scipy_multichannel():
+    """Test the vectorized 'scipy' method against scipy.signal.group_delay
+    for multiple channels and arbitrary frequencies."""
+    np.random.seed(0)
+    signal = pf.Signal(np.random.rand(2, 3, 64), 44100)
+    frequencies = np.array([100.5, 1234.5, 10000])
+    grp = dsp.group_delay(signal, frequencies, method='scipy')
+    assert grp.shape == signal.cshape + (frequencies.size, )
+    for idx in np.ndindex(signal.cshape):
+        truth = sgn.group_delay(
+            (signal.time[idx], 1), frequencies, fs=signal.sampling_rate)[1]
+        npt.assert_allclose(grp[idx], truth, rtol=1e-10)
+
+
+@pytest.mark.parametrize("frequencies", [None, [11025, 22050]])
+def test_group_delay_scipy_singular(frequencies):
+    """Test the warning for singular values in the 'scipy' method."""
+    # spectrum is zero at half the sampling rate
+    signal = pf.Signal([1, 1], 44100)
+    with pytest.warns(UserWarning, match=r"singular at frequencies \[22050"):
+        grp = dsp.group_delay(signal, frequencies, method='scipy')
+    npt.assert_allclose(grp, [.5, 0], atol=1e-14)
+
+
+def test_group_delay_scipy_blocks(monkeypatch):
+    """Test evaluating the DTFT for arbitrary frequencies in blocks."""
+    np.random.seed(0)
+    signal = pf.Signal(np.random.rand(2, 64), 44100)
+    frequencies = np.linspace(100, 20000, 11)
+    truth = dsp.group_delay(signal, frequencies, method='scipy')
+    # blocks of two frequencies with the last block containing only one
+    monkeypatch.setattr(pf.dsp.dsp, '_DTFT_BLOCK_SIZE', 2 * 64)
+    grp = dsp.group_delay(signal, frequencies, method='scipy')
+    npt.assert_allclose(grp, truth, rtol=1e-12)
+
+
+def test_wrap_to_2pi():
+    """Test wrapping the phase to 2 pi."""
+    x = np.array([-2*np.pi, -np.pi, 0, np.pi, 2*np.pi, 3*np.pi, 4*np.pi])
+    truth = np.array([0, np.pi, 0, np.pi, 2*np.pi, np.pi, 2*np.pi])
+    npt.assert_allclose(dsp.wrap_to_2pi(x), truth, atol=1e-14)
+
+
 def test_linear_phase():
     # test signal
     N = 64
@@ -191,6 +222,23 @@ def test_xfade(impulse):
     np.testing.assert_array_almost_equal(second[idx_2:], res[idx_2:])
 
 
+def test_xfade_scalar_out():
+    """Test cross-fading scalars and in place using the out parameter."""
+    first = np.ones(5001)
+    second = np.ones(5001)*2
+    indices = [500, 1000]
+    expected = dsp.dsp._cross_fade(first, second, indices)
+
+    out = np.empty(5001)
+    res = dsp.dsp._cross_fade(1, 2, indices, out=out)
+    assert res is out
+    npt.assert_allclose(res, expected)
+
+    res = dsp.dsp._cross_fade(first, 2, indices, out=first)
+    assert res is first
+    npt.assert_allclose(res, expected)
+
+
 def test_regularized_spectrum_inversion(impulse):
     """Test regularized_spectrum_inversion"""
     res = dsp.regularized_spectrum_inversion(impulse * 2, [200, 10e3])
@@ -324,17 +372,17 @@ def test_time_shift_assertions():
     dsp.time_shift(impulse(10), 20, mode='cyclic')
 
 
-def test_time_window_default():
+def test_time_window_default(ones_signal_factory):
     """ Test time_window function with default values."""
-    sig = pyfar.Signal(np.ones(10), 2)
+    sig = ones_signal_factory(10, 2)
     sig_win = dsp.time_window(sig, interval=(0, sig.n_samples-1))
     time_win = np.atleast_2d(sgn.windows.hann(10, sym=True))
     npt.assert_allclose(sig_win.time, time_win)
 
 
-def test_time_window_input():
+def test_time_window_input(ones_signal_factory):
     """Test errors when calling with incorrect parameters."""
-    sig = pyfar.Signal(np.ones(5), 2)
+    sig = ones_signal_factory(5, 2)
     with pytest.raises(TypeError, match='signal'):
         dsp.time_window([1., 2.], interval=(0, 4))
     with pytest.raises(ValueError, match='shape'):
@@ -353,80 +401,70 @@ def test_time_window_input():
         dsp.time_window(sig, interval=['a', 'b'])
 
 
-def test_time_window_interval_types():
-    sig = pyfar.Signal(np.ones(10), 2)
+def test_time_window_interval_types(ones_signal_factory):
+    sig = ones_signal_factory(10, 2)
     dsp.time_window(sig, interval=(1, 2))
     dsp.time_window(sig, interval=[1, 2])
     dsp.time_window(sig, interval=(1, 2, 3, 4))
     dsp.time_window(sig, interval=[1, 2, 3, 4])
 
 
-def test_time_window_interval_order_error():
+def test_time_window_interval_order_error(ones_signal_factory):
     """ Test errors for incorrect order of values in interval."""
-    sig = pyfar.Signal(np.ones(10), 2)
+    sig = ones_signal_factory(10, 2)
     with pytest.raises(ValueError, match='ascending'):
         dsp.time_window(sig, interval=[2, 1])
     with pytest.raises(ValueError, match='ascending'):
         dsp.time_window(sig, interval=[1, 2, 3, 0])
 
 
-def test_time_window_interval_unit_error():
+def test_time_window_interval_unit_error(ones_signal_factory):
     """ Test errors for incorrect boundaries in combinations with unit."""
-    sig = pyfar.Signal(np.ones(10), 2)
+    sig = ones_signal_factory(10, 2)
     with pytest.raises(ValueError, match='than signal'):
         dsp.time_window(sig, interval=[0, 11], unit='samples')
     with pytest.raises(ValueError, match='than signal'):
         dsp.time_window(sig, interval=[0, 6], unit='s')
 
 
-def test_time_window_crop_none():
+def test_time_window_crop_none(ones_signal_factory):
     """ Test crop option 'none'."""
-    sig = pyfar.Signal(np.ones(10), 2)
+    sig = ones_signal_factory(10, 2)
     sig_win = dsp.time_window(sig, interval=[1, 3], crop='none')
     assert sig_win.n_samples == 10
 
 
-def test_time_window_crop_interval():
+@pytest.mark.parametrize("interval,shape,unit,n_samples", [
+    ([1, 3], 'symmetric', 'samples', 3),
+    ([0.5, 1.5], 'symmetric', 's', 3),
+    ([1, 3], 'left', 'samples', 9),
+    ([1, 3], 'right', 'samples', 4)])
+def test_time_window_crop_interval(
+        ones_signal_factory, interval, shape, unit, n_samples):
     """ Test truncation of windowed signal to interval."""
-    sig = pyfar.Signal(np.ones(10), 2)
+    sig = ones_signal_factory(10, 2)
     sig_win = dsp.time_window(
-        sig, interval=[1, 3], shape='symmetric', unit='samples',
-        crop='window')
-    assert sig_win.n_samples == 3
-    sig_win = dsp.time_window(
-        sig, interval=[0.5, 1.5], shape='symmetric', unit='s',
-        crop='window')
-    assert sig_win.n_samples == 3
-    sig_win = dsp.time_window(
-        sig, interval=[1, 3], shape='left', crop='window')
-    assert sig_win.n_samples == 9
-    sig_win = dsp.time_window(
-        sig, interval=[1, 3], shape='right', crop='window')
-    assert sig_win.n_samples == 4
+        sig, interval=interval, shape=shape, unit=unit, crop='window')
+    assert sig_win.n_samples == n_samples
 
 
-def test_time_window_crop_end():
+@pytest.mark.parametrize("interval,shape,unit,n_samples", [
+    ([1, 3], 'symmetric', 'samples', 4),
+    ([0.5, 1.5], 'symmetric', 's', 4),
+    ([1, 3], 'left', 'samples', 10),
+    ([1, 3], 'right', 'samples', 4)])
+def test_time_window_crop_end(
+        ones_signal_factory, interval, shape, unit, n_samples):
     """ Test crop option 'end'."""
-    sig = pyfar.Signal(np.ones(10), 2)
-    sig_win = dsp.time_window(
-        sig, interval=[1, 3], shape='symmetric', unit='samples',
-        crop='end')
-    assert sig_win.n_samples == 4
-    sig_win = dsp.time_window(
-        sig, interval=[0.5, 1.5], shape='symmetric', unit='s',
-        crop='end')
-    assert sig_win.n_samples == 4
-    sig_win = dsp.time_window(
-        sig, interval=[1, 3], shape='left', crop='end')
-    assert sig_win.n_samples == 10
+    sig = ones_signal_factory(10, 2)
     sig_win = dsp.time_window(
-        sig, interval=[1, 3], shape='right', crop='end')
-    assert sig_win.n_samples == 4
+        sig, interval=interval, shape=shape, unit=unit, crop='end')
+    assert sig_win.n_samples == n_samples
 
 
-def test_time_window_symmetric():
+def test_time_window_symmetric(ones_signal_factory):
     """ Test window option symmetric."""
-    sig = pyfar.Signal(np.ones(10), 2)
+    sig = ones_signal_factory(10, 2)
     sig_win = dsp.time_window(
         sig, interval=[1, 5], window='hann', shape='symmetric',
         crop='window')
@@ -434,18 +472,18 @@ def test_time_window_symmetric():
     npt.assert_allclose(sig_win.time, time_win)
 
 
-def test_time_window_symmetric_zero():
+def test_time_window_symmetric_zero(ones_signal_factory):
     """ Test window option symmetric_zero."""
-    sig = pyfar.Signal(np.ones(12), 2)
+    sig = ones_signal_factory(12, 2)
     sig_win = dsp.time_window(
         sig, window='triang', interval=[2, 4], shape='symmetric_zero')
     time_win = np.array([[1, 1, 1, 0.75, 0.25, 0, 0, 0, 0.25, 0.75, 1, 1]])
     npt.assert_allclose(sig_win.time, time_win)
 
 
-def test_time_window_left():
+def test_time_window_left(ones_signal_factory):
     """ Test window options left."""
-    sig = pyfar.Signal(np.ones(7), 1)
+    sig = ones_signal_factory(7, 1)
     # Odd number of samples, crop='none'
     sig_win = dsp.time_window(
         sig, window='triang', interval=[2, 4], shape='left', crop='none')
@@ -468,9 +506,9 @@ def test_time_window_left():
     npt.assert_allclose(sig_win.time, time_win)
 
 
-def test_time_window_right():
+def test_time_window_right(ones_signal_factory):
     """ Test window options right."""
-    sig = pyfar.Signal(np.ones(7), 1)
+    sig = ones_signal_factory(7, 1)
     # Odd number of samples, crop='none'
     sig_win = dsp.time_window(
         sig, window='triang', interval=[2, 4], shape='right', crop='none')
@@ -493,14 +531,14 @@ def test_time_window_right():
     npt.assert_allclose(sig_win.time, time_win)
 
 
-def test_time_window_interval_four_values():
+def test_time_window_interval_four_values(ones_signal_factory):
     """ Test time_window with four values given in interval."""
-    sig = pyfar.Signal(np.ones(9), 1)
+    sig = ones_signal_factory(9, 1)
     sig_win = dsp.time_window(
         sig, window='triang', interval=[1, 3, 6, 7], crop='none')
     time_win = np.array([[0, 0.25, 0.75, 1, 1, 1, 1, 0.5, 0]])
     npt.assert_allclose(sig_win.time, time_win)
-    sig = pyfar.Signal(np.ones(10), 1)
+    sig = ones_signal_factory(10, 1)
     sig_win = dsp.time_window(
         sig, window='triang', interval=[1, 3, 6, 7], crop='none')
     time_win = np.array([[0, 0.25, 0.75, 1, 1, 1, 1, 0.5, 0, 0]])
@@ -521,9 +559,9 @@ def test_time_window_multichannel():
 
 
 @pytest.mark.parametrize("crop", ['none', 'window', 'end'])
-def test_time_window_return_window(crop):
+def test_time_window_return_window(ones_signal_factory, crop):
     """ Test return window parameter."""
-    sig = pyfar.Signal(np.ones(10), 44100)
+    sig = ones_signal_factory(10, 44100)
     sig_win, win = dsp.time_window(
         sig, interval=(4, 8), crop=crop, return_window=True)
     assert isinstance(win, pyfar.Signal)
@@ -535,9 +573,9 @@ def test_time_window_return_window(crop):
     assert win.comment == desired_comment
 
 
-def test_time_window_return_window_error():
+def test_time_window_return_window_error(ones_signal_factory):
     """ Test return window with non bool parameter."""
-    sig = pyfar.Signal(np.ones(10), 44100)
+    sig = ones_signal_factory(10, 44100)
     with pytest.raises(TypeError, match="boolean"):
         dsp.time_window(sig, interval=(4, 8), return_window='a')
 
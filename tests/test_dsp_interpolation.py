@@ -2,7 +2,6 @@ import pytest
 from pytest import raises
 import numpy as np
 import numpy.testing as npt
-import matplotlib.pyplot as plt
 import os
 import pyfar as pf
 from pyfar.dsp import (InterpolateSpectrum,
@@ -229,8 +228,8 @@ def test_interpolate_spectrum_init_assertions():
     with raises(TypeError, match="data must be"):
         InterpolateSpectrum(1, "complex", ("linear", "linear", "linear"))
     # data (not enough bins)
+    fd_short = pf.FrequencyData(1, 100)
     with raises(ValueError, match="data.n_bins must be at least 2"):
-        fd_short = pf.FrequencyData(1, 100)
         InterpolateSpectrum(
             fd_short, "complex", ("linear", "linear", "linear"))
 
@@ -364,6 +363,7 @@ def test_interpolate_spectrum_show():
     This only tests if the code finishes without errors. Because the plot is
     an informal plot for inspection, we don't test specifics of the figure and
     axes for speed up the testing."""
+    import matplotlib.pyplot as plt
 
     data = pf.FrequencyData([1, 2], [1, 2])
     interpolator = InterpolateSpectrum(
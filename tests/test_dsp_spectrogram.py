@@ -35,6 +35,22 @@ def test_return_values():
     npt.assert_allclose(spectro[256, 1], 1, atol=1e-13)
     npt.assert_allclose(spectro[257:, 1], 0, atol=1e-13)
 
+    # check normalization of all slices
+    npt.assert_allclose(spectro[256], 1, atol=1e-13)
+
+
+@pytest.mark.parametrize('fft_norm,value', [
+    ('unitary', 1024), ('amplitude', 1), ('rms', 1 / np.sqrt(2)),
+    ('power', .5), ('psd', .5 / 1024)])
+def test_fft_norm(fft_norm, value):
+    """Test normalization of all slices for all FFT normalizations"""
+    signal = pf.signals.sine(256, 2*1024, sampling_rate=1024)
+    signal.fft_norm = fft_norm
+    _, _, spectro = pf.dsp.spectrogram(signal, window='rect')
+
+    npt.assert_allclose(spectro[256], value, rtol=1e-13)
+    npt.assert_allclose(spectro[:256], 0, atol=1e-10)
+
 
 @pytest.mark.parametrize('window,value', [
     ('rect', [0, 1, 0]),         # rect window does not spread energy
@@ -328,6 +328,15 @@ def test_normalization_with_window_value_error():
                           'amplitude', window=[1, 1, 1, 1, 1])
 
 
+def test_normalization_input_unchanged():
+    """Test if the input spectrum is not changed by the normalization."""
+    spec = np.array([1, 2 + 1j, 3], dtype=complex)
+    spec_copy = spec.copy()
+    for fft_norm in ['unitary', 'amplitude', 'rms', 'power', 'psd']:
+        fft.normalization(spec, 4, 44100, fft_norm)
+        npt.assert_array_equal(spec, spec_copy)
+
+
 def test_normalization_exceptions():
     # Call without numpy array
     with raises(ValueError):
@@ -284,6 +284,6 @@ def test_reconstructing_fractional_octave_bands_filter_slopes():
 
 def test_reconstructing_fractional_octave_bands_warning():
     """Test warning for octave frequency exceeding half the sampling rate."""
+    x = pf.signals.impulse(2**12, sampling_rate=16e3)
     with pytest.warns(UserWarning):
-        x = pf.signals.impulse(2**12, sampling_rate=16e3)
         y, f = pfilt.reconstructing_fractional_octave_bands(x)
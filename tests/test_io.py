@@ -9,6 +9,7 @@ from pyfar.testing.stub_utils import stub_str_to_type, stub_is_pyfar_type
 import os.path
 import pathlib
 import soundfile
+import zipfile
 
 from pyfar import io
 from pyfar import Signal
@@ -113,6 +114,37 @@ def test_write_read_multipleObjects(flat_data, nested_data, tmpdir):
     assert actual['any_nested_data'] == nested_data
 
 
+@pytest.mark.parametrize("compress,compress_type", [
+    (False, zipfile.ZIP_STORED),
+    (True, zipfile.ZIP_DEFLATED),
+    (9, zipfile.ZIP_DEFLATED)])
+def test_write_compress(compress, compress_type, tmpdir):
+    """ Check if data is only compressed if requested."""
+    filename = os.path.join(tmpdir, 'compress.far')
+    io.write(filename, compress=compress, array=np.zeros(1000))
+    with zipfile.ZipFile(filename) as zip_file:
+        for info in zip_file.infolist():
+            assert info.compress_type == compress_type
+    npt.assert_array_equal(io.read(filename)['array'], np.zeros(1000))
+
+
+@pytest.mark.parametrize("compress", [10, 0, 5.0, '5'])
+def test_write_compress_ValueError(compress, tmpdir):
+    filename = os.path.join(tmpdir, 'compress.far')
+    with pytest.raises(ValueError, match='between 1 and 9'):
+        io.write(filename, compress=compress, array=np.zeros(1000))
+
+
+def test_write_missing_directory(tmpdir):
+    """Test that the original error is raised if the file can not be
+    opened."""
+    filename = os.path.join(tmpdir, 'missing', 'data.far')
+    with pytest.raises(FileNotFoundError) as error:
+        io.write(filename, array=np.zeros(10))
+    assert error.value.__context__ is None
+    assert not os.path.exists(os.path.join(tmpdir, 'missing'))
+
+
 def test_write_anyObj_TypeError(any_obj, tmpdir):
     """ Check if a TypeError is raised when writing an arbitrary
     object.
@@ -120,6 +152,8 @@ def test_write_anyObj_TypeError(any_obj, tmpdir):
     filename = os.path.join(tmpdir, 'anyObj.far')
     with pytest.raises(TypeError):
         io.write(filename, any_obj=any_obj)
+    # no partially written files remain on disk
+    assert os.listdir(tmpdir) == []
 
 
 @patch('pyfar.io._codec._str_to_type', new=stub_str_to_type())
@@ -351,6 +385,28 @@ def test_write_read_builtins(dict_of_builtins, tmpdir):
     assert dict_of_builtins.items() <= actual.items()
 
 
+def test_write_read_lazy(sine, dict_of_builtins, tmpdir):
+    """ Check if objects are decoded on access when reading lazily."""
+    filename = os.path.join(tmpdir, 'lazy.far')
+    matrix = np.arange(0, 24, dtype=int).reshape((4, 6))
+    io.write(filename, signal=sine, matrix=matrix, **dict_of_builtins)
+    expected = io.read(filename)
+
+    with io.read(filename, lazy=True) as actual:
+        assert list(actual) == list(expected)
+        assert len(actual) == len(expected)
+        # builtins are known right away, other objects are decoded on access
+        assert 'signal' not in actual._cache
+        assert actual['signal'] == sine
+        assert 'signal' in actual._cache
+        assert actual['signal'] is actual['signal']
+        npt.assert_array_equal(actual['matrix'], matrix)
+        assert dict_of_builtins.items() <= actual.items()
+        with pytest.raises(KeyError):
+            actual['not_in_file']
+    assert actual._file.closed
+
+
 def test_write_read_multiplePyfarObjects(
         filter,
         filterFIR,
@@ -540,15 +596,25 @@ def test_write_audio_overwrite(noise, tmpdir):
     io.write_audio(noise, filename, overwrite=True)
 
 
-@patch('soundfile.write')
-def test_write_audio_kwargs(sf_write_mock, noise):
+@patch('soundfile.SoundFile')
+def test_write_audio_kwargs(sf_mock, noise):
     pyfar.io.write_audio(
         signal=noise, filename='test.wav', kwarg1='kwarg1', kwarg2='kwarg2')
-    actual_args = sf_write_mock.call_args[1]
+    actual_args = sf_mock.call_args[1]
     assert actual_args['kwarg1'] == 'kwarg1'
     assert actual_args['kwarg2'] == 'kwarg2'
 
 
+def test_write_audio_blocks(tmpdir, monkeypatch):
+    """Test writing audio data in multiple blocks."""
+    monkeypatch.setattr(io.io, '_AUDIO_BLOCK_SIZE', 100)
+    signal = pyfar.signals.noise(1001, seed=1, rms=.1)
+    signal.time = np.concatenate((signal.time, -signal.time))
+    filename = os.path.join(tmpdir, 'test_wav.wav')
+    io.write_audio(signal, filename, subtype='DOUBLE')
+    npt.assert_array_equal(io.read_audio(filename).time, signal.time)
+
+
 def test_write_audio_nd(noise_two_by_three_channel, tmpdir):
     """Test for signals of higher dimension."""
     filename = os.path.join(tmpdir, 'test_wav.wav')
@@ -561,10 +627,11 @@ def test_write_audio_nd(noise_two_by_three_channel, tmpdir):
         atol=1e-4)
 
 
-@patch('soundfile.write')
-def test_write_audio_clip(sf_write_mock):
+@pytest.mark.parametrize("data", [[1., 2., 3.], [-1., -2., -3.]])
+@patch('soundfile.SoundFile')
+def test_write_audio_clip(sf_mock, data):
     """Test for clipping warning."""
-    signal = pyfar.Signal([1., 2., 3.], 44100)
+    signal = pyfar.Signal(data, 44100)
     with pytest.warns(Warning, match='clipped'):
         pyfar.io.write_audio(
             signal=signal, filename='test.wav', subtype='PCM_16')
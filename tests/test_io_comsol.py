@@ -317,6 +317,16 @@ def test_read_comsol_parameters_shape(filename, type):
     assert data.n_bins == 2
 
 
+@pytest.mark.parametrize("type",  ['.txt', '.dat', '.csv'])
+def test_read_comsol_error_missing_parameter(type):
+    path = os.path.join(
+        os.getcwd(), 'tests', 'test_io_data', 'pressure_parametric')
+    _, _, parameters, _, _ = io.read_comsol_header(path + type)
+    parameters.pop('phi')
+    with pytest.raises(ValueError, match='unambiguously'):
+        io.read_comsol(path + type, parameters=parameters)
+
+
 @pytest.mark.parametrize("filename",  [
     'intensity_parametric',
     'intensity_average',
@@ -7,6 +7,20 @@ from scipy.spatial.transform import Rotation
 from pyfar import Orientations
 from pyfar import Coordinates
 
+# read-only view and up vectors shared by the tests
+_VIEW = np.array([1, 0, 0])
+_UP = np.array([0, 1, 0])
+_AXES = np.array([
+    [1, 0, 0],
+    [-1, 0, 0],
+    [0, 1, 0],
+    [0, -1, 0],
+    [0, 0, 1],
+    [0, 0, -1]])
+_VIEW.setflags(write=False)
+_UP.setflags(write=False)
+_AXES.setflags(write=False)
+
 
 def test_orientations_init():
     """Init `Orientations` without optional parameters."""
@@ -17,9 +31,7 @@ def test_orientations_init():
 def test_orientations_from_view_up():
     """Create `Orientations` from view and up vectors."""
     # test with single view and up vectors
-    view = [1, 0, 0]
-    up = [0, 1, 0]
-    Orientations.from_view_up(view, up)
+    Orientations.from_view_up(_VIEW, _UP)
     # test with multiple view and up vectors
     views = [[1, 0, 0], [0, 0, 1]]
     ups = [[0, 1, 0], [0, 1, 0]]
@@ -41,9 +53,9 @@ def test_orientations_from_view_up():
     ups = [[0, 1, 0], [0, 1, 0]]
     Orientations.from_view_up(views, ups)
     # number of views to ups M:N
+    views = [[1, 0, 0], [0, 0, 1], [0, 0, 1]]
+    ups = [[0, 1, 0], [0, 1, 0]]
     with raises(ValueError):
-        views = [[1, 0, 0], [0, 0, 1], [0, 0, 1]]
-        ups = [[0, 1, 0], [0, 1, 0]]
         Orientations.from_view_up(views, ups)
 
 
@@ -79,9 +91,7 @@ def test_orientations_show(views, ups, positions, orientations):
     # default orientation
     Orientations().show()
     # single vectors no position
-    view = [1, 0, 0]
-    up = [0, 1, 0]
-    orientation_single = Orientations.from_view_up(view, up)
+    orientation_single = Orientations.from_view_up(_VIEW, _UP)
     orientation_single.show()
     # with position
     position = Coordinates(0, 1, 0)
@@ -162,21 +172,13 @@ def test_as_view_up_right(views, ups, orientations):
 
 
 def test_from_view_as_view_roundtrip():
-    vec = np.array([
-        [1, 0, 0],
-        [-1, 0, 0],
-        [0, 1, 0],
-        [0, -1, 0],
-        [0, 0, 1],
-        [0, 0, -1]])
-
-    for v1 in range(len(vec)):
-        for v2 in range(len(vec)):
-            if np.all(np.abs(vec[v1]) == np.abs(vec[v2])):
+    for v1 in range(len(_AXES)):
+        for v2 in range(len(_AXES)):
+            if np.all(np.abs(_AXES[v1]) == np.abs(_AXES[v2])):
                 continue
             print(f"Testing combination ({v1}, {v2})")
-            views = np.atleast_2d(vec[v1])
-            ups = np.atleast_2d(vec[v2])
+            views = np.atleast_2d(_AXES[v1])
+            ups = np.atleast_2d(_AXES[v2])
 
             orientations = Orientations.from_view_up(views, ups)
             views_, ups_, _ = orientations.as_view_up_right()
@@ -273,14 +273,13 @@ def test_2d_points_orientation(
     """Test 2D plots with varing `points` and `orientation` parameters"""
     print(f"Testing: {function.__name__}")
     points_label = 'points-default' if points == 'default' else 'points-custom'
-    signal = handsome_signal_2d
     if points == 'custom':
         points = np.linspace(0, 360, np.prod(handsome_signal_2d.cshape))
     else:
         points = None
     filename = f'{function.__name__}_{orientation}_{points_label}'
     create_figure()
-    function(signal, indices=points, orientation=orientation)
+    function(handsome_signal_2d, indices=points, orientation=orientation)
     save_and_compare(create_baseline, baseline_path, output_path, filename,
                      file_type, compare_output)
 